@@ -0,0 +1,42 @@
+"""Add storage_stats function for single round-trip storage statistics
+
+Revision ID: 5b2e9f0c7a41
+Revises: 074c54636a56
+Create Date: 2025-09-02 10:14:37.118402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e9f0c7a41'
+down_revision: Union[str, Sequence[str], None] = '074c54636a56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Return all per-user counts in one row so get_storage_stats needs a
+    # single RPC instead of three sequential count queries
+    op.execute("""
+        CREATE OR REPLACE FUNCTION storage_stats(uid text)
+        RETURNS TABLE(
+            journal_entries bigint,
+            preferences bigint,
+            storage_records bigint
+        ) AS $$
+            SELECT
+                (SELECT count(*) FROM trading_journal WHERE user_id = uid),
+                (SELECT count(*) FROM user_preferences WHERE user_id = uid),
+                (SELECT count(*) FROM storage_records WHERE user_id = uid)
+        $$ LANGUAGE sql STABLE
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP FUNCTION IF EXISTS storage_stats(text)')
@@ -0,0 +1,40 @@
+"""Add (user_id, created_at DESC) indexes for per-user listing queries
+
+Revision ID: 8d4c1a6e3f92
+Revises: 5b2e9f0c7a41
+Create Date: 2025-09-03 09:41:12.664930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4c1a6e3f92'
+down_revision: Union[str, Sequence[str], None] = '5b2e9f0c7a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # get_journal_entries and query_records filter on user_id and order by
+    # created_at DESC with a LIMIT; a composite index serves both directly
+    op.create_index(
+        'idx_trading_journal_user_created',
+        'trading_journal',
+        ['user_id', sa.text('created_at DESC')]
+    )
+    op.create_index(
+        'idx_storage_records_user_created',
+        'storage_records',
+        ['user_id', sa.text('created_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_storage_records_user_created', table_name='storage_records')
+    op.drop_index('idx_trading_journal_user_created', table_name='trading_journal')
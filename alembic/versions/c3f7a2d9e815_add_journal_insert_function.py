@@ -0,0 +1,38 @@
+"""Add journal_insert function so inserts build ids and timestamps server-side
+
+Revision ID: c3f7a2d9e815
+Revises: 8d4c1a6e3f92
+Create Date: 2025-09-04 15:22:48.305117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f7a2d9e815'
+down_revision: Union[str, Sequence[str], None] = '8d4c1a6e3f92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Insert a journal entry and return its id; the id and both timestamps
+    # come from column defaults, so the client only sends the entry itself.
+    # SECURITY INVOKER (the default) keeps the caller's RLS policies in force
+    op.execute("""
+        CREATE OR REPLACE FUNCTION journal_insert(uid text, e text, m json)
+        RETURNS uuid AS $$
+            INSERT INTO trading_journal (user_id, entry, metadata)
+            VALUES (uid, e, coalesce(m, '{}'::json))
+            RETURNING id
+        $$ LANGUAGE sql VOLATILE
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP FUNCTION IF EXISTS journal_insert(text, text, json)')
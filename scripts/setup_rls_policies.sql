@@ -4,6 +4,10 @@
 -- 1. User data isolation (users can only access their own data)
 -- 2. Secure anon key access (no direct user_id_hash exposure)
 -- 3. Proper authentication flow
+--
+-- Every policy wraps auth.*() / current_setting() in (select ...) so Postgres
+-- evaluates it once per statement instead of once per row, which lets the
+-- planner use the user_id indexes at the bottom of this file.
 
 -- =============================================================================
 -- TRADING JOURNAL - User's trading journal data
@@ -16,29 +20,29 @@ ALTER TABLE trading_journal ENABLE ROW LEVEL SECURITY;
 -- Uses user_id from JWT claim or direct comparison
 CREATE POLICY "Users can view own journal entries" ON trading_journal
     FOR SELECT USING (
-        user_id = auth.jwt() ->> 'user_id'
-        OR user_id = current_setting('app.user_id', true)
+        user_id = (select auth.jwt() ->> 'user_id')
+        OR user_id = (select current_setting('app.user_id', true))
     );
 
 -- Policy: Users can insert their own journal entries
 CREATE POLICY "Users can insert own journal entries" ON trading_journal
     FOR INSERT WITH CHECK (
-        user_id = auth.jwt() ->> 'user_id'
-        OR user_id = current_setting('app.user_id', true)
+        user_id = (select auth.jwt() ->> 'user_id')
+        OR user_id = (select current_setting('app.user_id', true))
     );
 
 -- Policy: Users can update their own journal entries
 CREATE POLICY "Users can update own journal entries" ON trading_journal
     FOR UPDATE USING (
-        user_id = auth.jwt() ->> 'user_id'
-        OR user_id = current_setting('app.user_id', true)
+        user_id = (select auth.jwt() ->> 'user_id')
+        OR user_id = (select current_setting('app.user_id', true))
     );
 
 -- Policy: Users can delete their own journal entries
 CREATE POLICY "Users can delete own journal entries" ON trading_journal
     FOR DELETE USING (
-        user_id = auth.jwt() ->> 'user_id'
-        OR user_id = current_setting('app.user_id', true)
+        user_id = (select auth.jwt() ->> 'user_id')
+        OR user_id = (select current_setting('app.user_id', true))
     );
 
 -- =============================================================================
@@ -51,8 +55,8 @@ ALTER TABLE user_preferences ENABLE ROW LEVEL SECURITY;
 -- Policy: Users can manage their own preferences
 CREATE POLICY "Users can manage own preferences" ON user_preferences
     FOR ALL USING (
-        user_id = auth.jwt() ->> 'user_id'
-        OR user_id = current_setting('app.user_id', true)
+        user_id = (select auth.jwt() ->> 'user_id')
+        OR user_id = (select current_setting('app.user_id', true))
     );
 
 -- =============================================================================
@@ -65,8 +69,8 @@ ALTER TABLE storage_records ENABLE ROW LEVEL SECURITY;
 -- Policy: Users can manage their own storage records
 CREATE POLICY "Users can manage own storage records" ON storage_records
     FOR ALL USING (
-        user_id = auth.jwt() ->> 'user_id'
-        OR user_id = current_setting('app.user_id', true)
+        user_id = (select auth.jwt() ->> 'user_id')
+        OR user_id = (select current_setting('app.user_id', true))
     );
 
 -- =============================================================================
@@ -82,13 +86,13 @@ CREATE POLICY "Users can view own subscription" ON user_subscriptions
     FOR SELECT USING (
         -- Allow access if the user_id_hash matches the email hash
         -- This is calculated by the application layer
-        email = lower(trim(auth.jwt() ->> 'email'))
-        OR email = current_setting('app.user_email', true)
+        email = (select lower(trim(auth.jwt() ->> 'email')))
+        OR email = (select current_setting('app.user_email', true))
     );
 
 -- Policy: Service role can manage all subscriptions (for admin operations)
 CREATE POLICY "Service role can manage subscriptions" ON user_subscriptions
-    FOR ALL USING (auth.role() = 'service_role');
+    FOR ALL USING ((select auth.role()) = 'service_role');
 
 -- =============================================================================
 -- HELPER FUNCTIONS
@@ -140,12 +144,14 @@ $$ LANGUAGE plpgsql IMMUTABLE;
 -- Indexes for efficient RLS policy enforcement
 CREATE INDEX IF NOT EXISTS idx_trading_journal_user_id ON trading_journal(user_id);
 CREATE INDEX IF NOT EXISTS idx_trading_journal_created_at ON trading_journal(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_trading_journal_user_created ON trading_journal(user_id, created_at DESC);
 
 CREATE INDEX IF NOT EXISTS idx_user_preferences_user_id ON user_preferences(user_id);
 CREATE INDEX IF NOT EXISTS idx_user_preferences_key ON user_preferences(preference_key);
 
 CREATE INDEX IF NOT EXISTS idx_storage_records_user_id ON storage_records(user_id);
 CREATE INDEX IF NOT EXISTS idx_storage_records_type ON storage_records(record_type);
+CREATE INDEX IF NOT EXISTS idx_storage_records_user_created ON storage_records(user_id, created_at DESC);
 
 CREATE INDEX IF NOT EXISTS idx_user_subscriptions_email ON user_subscriptions(email);
 CREATE INDEX IF NOT EXISTS idx_user_subscriptions_status ON user_subscriptions(status);
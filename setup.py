@@ -47,10 +47,10 @@ setup(
         "sqlalchemy>=2.0.23",
         "alembic>=1.13.0",
         "asyncpg>=0.29.0",
-        "supabase>=2.0.0",
+        "supabase>=2.16.0",
         "mcp>=0.4.0",
         "cryptography>=41.0.0",
-        "httpx>=0.25.0",
+        "httpx[http2]>=0.25.0",
         "pandas>=2.1.0",
         "numpy>=1.24.0",
         "python-dotenv>=1.0.0",
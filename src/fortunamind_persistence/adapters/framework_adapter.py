@@ -23,7 +23,8 @@ except ImportError:
 
 from ..identity import EmailIdentity
 from ..subscription import SubscriptionValidator, SubscriptionTier
-from ..storage.interfaces import PersistentStorageInterface
+from ..subscription.tiers import has_feature
+from ..storage.interfaces import PersistentStorageInterface, PageCursor, encode_page_cursor
 from ..rate_limiting import RateLimiter
 
 logger = structlog.get_logger(__name__)
@@ -193,10 +194,8 @@ class FrameworkPersistenceAdapter:
         Returns:
             True if user has access, False otherwise
         """
-        from ..subscription.tiers import TierDefinitions
-        
         tier = user_context.get('tier', SubscriptionTier.FREE)
-        return TierDefinitions.has_feature(tier, feature)
+        return has_feature(tier, feature)
     
     async def check_rate_limit(
         self,
@@ -312,7 +311,8 @@ class FrameworkPersistenceAdapter:
         email: str,
         subscription_key: str,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        before: Optional[PageCursor] = None
     ) -> Dict[str, Any]:
         """
         Get journal entries with validation.
@@ -322,9 +322,12 @@ class FrameworkPersistenceAdapter:
             subscription_key: Subscription key
             limit: Maximum entries to return
             offset: Number of entries to skip
+            before: Keyset cursor from a previous page's ``next_cursor``
             
         Returns:
-            Dict with entries or error
+            Dict with entries or error. ``next_cursor`` is an opaque string,
+            set when the page is full, to pass back as ``before`` for the
+            next page.
         """
         try:
             # Validate user and get context
@@ -342,13 +345,22 @@ class FrameworkPersistenceAdapter:
             entries = await self.storage.get_journal_entries(
                 user_context['user_id'],
                 limit=limit,
-                offset=offset
+                offset=offset,
+                before=before
             )
             
+            next_cursor = None
+            if entries and len(entries) == limit:
+                last = entries[-1]
+                next_cursor = encode_page_cursor(
+                    datetime.fromisoformat(last['created_at']), last['id']
+                )
+            
             return {
                 'success': True,
                 'entries': entries,
                 'count': len(entries),
+                'next_cursor': next_cursor,
                 'tier': user_context['tier'].value
             }
             
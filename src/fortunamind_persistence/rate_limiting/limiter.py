@@ -12,7 +12,7 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple, Any
 import structlog
 
-from ..subscription.tiers import SubscriptionTier, TierDefinitions
+from ..subscription.tiers import SubscriptionTier, get_tier_limits
 
 logger = structlog.get_logger(__name__)
 
@@ -156,7 +156,7 @@ class RateLimiter:
             RateLimitResult with current usage and limits
         """
         current_time = time.time()
-        limits = TierDefinitions.get_limits(tier)
+        limits = get_tier_limits(tier)
         
         # Get or create counters for this user
         user_counters = self._counters[user_id]
@@ -312,7 +312,7 @@ class RateLimiter:
         """
         current_time = time.time()
         user_counters = self._counters[user_id]
-        limits = TierDefinitions.get_limits(tier)
+        limits = get_tier_limits(tier)
         
         stats = {
             'user_id_hash': user_id[:8],
@@ -8,7 +8,7 @@ Provides consistent API across different storage backends.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from enum import Enum
 import uuid
 
@@ -20,6 +20,7 @@ class RecordType(Enum):
     PERFORMANCE_DATA = "performance_data"
     TRADE_PLAN = "trade_plan"
     ALERT = "alert"
+    USAGE = "usage"
     CUSTOM = "custom"
 
 
@@ -45,6 +46,31 @@ class StorageRecord:
             self.updated_at = self.created_at
 
 
+# Keyset pagination cursor: (created_at, id) of the last item on the previous
+# page, either as a tuple or as the opaque string from encode_page_cursor
+PageCursor = Union[Tuple[datetime, str], str]
+
+
+def encode_page_cursor(created_at: datetime, record_id: str) -> str:
+    """Encode a keyset cursor as an opaque, JSON-safe string"""
+    return f"{created_at.isoformat()}|{record_id}"
+
+
+def decode_page_cursor(cursor: PageCursor) -> Tuple[datetime, str]:
+    """
+    Turn a cursor back into its (created_at, id) pair.
+    
+    Raises:
+        ValueError: If a string cursor is malformed
+    """
+    if not isinstance(cursor, str):
+        return cursor
+    created_at, sep, record_id = cursor.partition("|")
+    if not sep or not record_id:
+        raise ValueError("Invalid page cursor")
+    return datetime.fromisoformat(created_at), record_id
+
+
 class PersistentStorageInterface(ABC):
     """
     Abstract interface for persistent storage backends.
@@ -101,17 +127,24 @@ class PersistentStorageInterface(ABC):
         limit: int = 100,
         offset: int = 0,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        before: Optional[PageCursor] = None
     ) -> List[Dict[str, Any]]:
         """
         Retrieve journal entries for a user.
         
+        Entries are ordered newest first by (created_at, id). To page
+        through them, pass the (created_at, id) of the last entry of the
+        previous page as ``before``; this seeks straight to the next page
+        instead of scanning and discarding ``offset`` rows.
+        
         Args:
             user_id: User's unique identifier
             limit: Maximum number of entries to return
-            offset: Number of entries to skip
+            offset: Number of entries to skip (ignored when ``before`` is set)
             start_date: Filter entries after this date
             end_date: Filter entries before this date
+            before: Keyset cursor; only entries ordered after it are returned
             
         Returns:
             List of journal entries
@@ -232,6 +265,24 @@ class PersistentStorageInterface(ABC):
         """
         pass
     
+    async def store_records(
+        self,
+        records: List[StorageRecord]
+    ) -> List[str]:
+        """
+        Store several generic records.
+        
+        The default stores them one at a time; backends that can insert
+        many rows per round-trip should override this.
+        
+        Args:
+            records: StorageRecords to store
+            
+        Returns:
+            Record IDs, in input order
+        """
+        return [await self.store_record(record) for record in records]
+    
     @abstractmethod
     async def get_record(
         self,
@@ -257,17 +308,22 @@ class PersistentStorageInterface(ABC):
         record_type: Optional[RecordType] = None,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        before: Optional[PageCursor] = None
     ) -> List[StorageRecord]:
         """
         Query records with filters.
         
+        Records are ordered newest first by (created_at, id); see
+        get_journal_entries for how ``before`` is used to page.
+        
         Args:
             user_id: User's unique identifier
             record_type: Filter by record type
             filters: Additional filters to apply
             limit: Maximum number of records to return
-            offset: Number of records to skip
+            offset: Number of records to skip (ignored when ``before`` is set)
+            before: Keyset cursor; only records ordered after it are returned
             
         Returns:
             List of matching StorageRecords
@@ -347,6 +403,79 @@ class PersistentStorageInterface(ABC):
         """
         pass
     
+    # Streaming reads
+    async def iter_journal_entries(
+        self,
+        user_id: str,
+        page_size: int = 100,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream all journal entries for a user, newest first.
+        
+        Walks the keyset cursor page by page so only one page is held in
+        memory at a time, however many entries the user has.
+        
+        Args:
+            user_id: User's unique identifier
+            page_size: Number of entries fetched per round-trip
+            start_date: Filter entries after this date
+            end_date: Filter entries before this date
+            
+        Yields:
+            Journal entries
+        """
+        before: Optional[PageCursor] = None
+        while True:
+            page = await self.get_journal_entries(
+                user_id,
+                limit=page_size,
+                start_date=start_date,
+                end_date=end_date,
+                before=before
+            )
+            for entry in page:
+                yield entry
+            if len(page) < page_size:
+                return
+            last = page[-1]
+            before = (datetime.fromisoformat(last['created_at']), last['id'])
+    
+    async def iter_records(
+        self,
+        user_id: str,
+        record_type: Optional[RecordType] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = 100
+    ) -> AsyncIterator[StorageRecord]:
+        """
+        Stream all matching records for a user, newest first.
+        
+        Args:
+            user_id: User's unique identifier
+            record_type: Filter by record type
+            filters: Additional filters to apply
+            page_size: Number of records fetched per round-trip
+            
+        Yields:
+            Matching StorageRecords
+        """
+        before: Optional[PageCursor] = None
+        while True:
+            page = await self.query_records(
+                user_id,
+                record_type=record_type,
+                filters=filters,
+                limit=page_size,
+                before=before
+            )
+            for record in page:
+                yield record
+            if len(page) < page_size:
+                return
+            before = (page[-1].created_at, page[-1].id)
+    
     # Context managers for transactions
     async def __aenter__(self):
         """Async context manager entry"""
@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 import structlog
 from collections import defaultdict
 
-from .interfaces import PersistentStorageInterface, StorageRecord, RecordType
+from .interfaces import PersistentStorageInterface, StorageRecord, RecordType, PageCursor, decode_page_cursor
 
 logger = structlog.get_logger(__name__)
 
@@ -80,15 +80,15 @@ class MockStorage(PersistentStorageInterface):
         self._record_operation('store_journal_entry')
         
         entry_id = str(uuid.uuid4())
-        now = datetime.utcnow()
+        now_iso = datetime.utcnow().isoformat()
         
         journal_entry = {
             'id': entry_id,
             'user_id': user_id,
             'entry': entry,
             'metadata': metadata or {},
-            'created_at': now.isoformat(),
-            'updated_at': now.isoformat()
+            'created_at': now_iso,
+            'updated_at': now_iso
         }
         
         self.journal_entries[user_id].append(journal_entry)
@@ -107,7 +107,8 @@ class MockStorage(PersistentStorageInterface):
         limit: int = 100,
         offset: int = 0,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        before: Optional[PageCursor] = None
     ) -> List[Dict[str, Any]]:
         """Retrieve journal entries for a user"""
         self._record_operation('get_journal_entries')
@@ -128,11 +129,22 @@ class MockStorage(PersistentStorageInterface):
                 filtered_entries.append(entry)
             entries = filtered_entries
         
-        # Sort by created_at descending
-        entries.sort(key=lambda x: x['created_at'], reverse=True)
+        # Sort by (created_at, id) descending
+        entries.sort(
+            key=lambda x: (datetime.fromisoformat(x['created_at']), x['id']),
+            reverse=True
+        )
         
         # Apply pagination
-        entries = entries[offset:offset + limit]
+        if before:
+            seek = decode_page_cursor(before)
+            entries = [
+                e for e in entries
+                if (datetime.fromisoformat(e['created_at']), e['id']) < seek
+            ]
+            entries = entries[:limit]
+        else:
+            entries = entries[offset:offset + limit]
         
         logger.debug(
             "Mock journal entries retrieved",
@@ -291,7 +303,8 @@ class MockStorage(PersistentStorageInterface):
         record_type: Optional[RecordType] = None,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        before: Optional[PageCursor] = None
     ) -> List[StorageRecord]:
         """Query records with filters"""
         self._record_operation('query_records')
@@ -315,11 +328,15 @@ class MockStorage(PersistentStorageInterface):
                     filtered_records.append(record)
             records = filtered_records
         
-        # Sort by created_at descending
-        records.sort(key=lambda x: x.created_at, reverse=True)
+        # Sort by (created_at, id) descending
+        records.sort(key=lambda x: (x.created_at, x.id), reverse=True)
         
         # Apply pagination
-        records = records[offset:offset + limit]
+        if before:
+            seek = decode_page_cursor(before)
+            records = [r for r in records if (r.created_at, r.id) < seek][:limit]
+        else:
+            records = records[offset:offset + limit]
         
         # Return copies to avoid mutation
         result = []
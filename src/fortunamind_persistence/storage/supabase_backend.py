@@ -5,23 +5,28 @@ Production-ready storage implementation using Supabase PostgreSQL with
 Row Level Security for user isolation.
 """
 
+import asyncio
 import json
-import uuid
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
+import httpx
 import structlog
 
 try:
-    from supabase import create_client, Client
+    from supabase import create_client, Client, ClientOptions
     SUPABASE_AVAILABLE = True
 except ImportError:
     SUPABASE_AVAILABLE = False
     Client = Any
 
-from .interfaces import PersistentStorageInterface, StorageRecord, RecordType
+from .interfaces import PersistentStorageInterface, StorageRecord, RecordType, PageCursor, decode_page_cursor
 
 logger = structlog.get_logger(__name__)
 
+# Value -> member map so row conversion skips EnumMeta.__call__
+_RECORD_TYPES = {record_type.value: record_type for record_type in RecordType}
+
 
 class SupabaseStorage(PersistentStorageInterface):
     """
@@ -67,11 +72,13 @@ class SupabaseStorage(PersistentStorageInterface):
             )
         
         self.client: Optional[Client] = None
+        self._http: Optional[httpx.Client] = None
         self._initialized = False
+        self._url_prefix = self.url[:30] + "..." if len(self.url) > 30 else self.url
         
         logger.info(
             "Supabase storage configured from environment",
-            url_prefix=self.url[:30] + "..." if len(self.url) > 30 else self.url
+            url_prefix=self._url_prefix
         )
     
     async def initialize(self) -> bool:
@@ -82,13 +89,27 @@ class SupabaseStorage(PersistentStorageInterface):
             True if initialization successful, False otherwise
         """
         try:
-            # Create Supabase client (url and key already validated in __init__)
-            self.client = create_client(self.url, self.key)
+            # Create Supabase client (url and key already validated in __init__).
+            # One long-lived HTTP/2 connection pool is shared by every query
+            # so repeated calls reuse warm connections instead of paying a
+            # TLS handshake each time.
+            self._http = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                timeout=httpx.Timeout(30.0, connect=5.0)
+            )
+            self.client = create_client(
+                self.url,
+                self.key,
+                options=ClientOptions(httpx_client=self._http)
+            )
             
             # Test connection with a simple query to a table we know exists
             # Use user_subscriptions since it's guaranteed to exist after migration
             try:
-                result = self.client.table('user_subscriptions').select('count').limit(1).execute()
+                result = await self._exec(
+                    self.client.table('user_subscriptions').select('count').limit(1)
+                )
                 logger.debug("Supabase connection test successful")
             except Exception as e:
                 # If tables don't exist yet, that's OK - migration hasn't run
@@ -98,7 +119,7 @@ class SupabaseStorage(PersistentStorageInterface):
             
             logger.info(
                 "Supabase storage initialized successfully",
-                url_prefix=self.url[:30] + "..." if len(self.url) > 30 else self.url
+                url_prefix=self._url_prefix
             )
             
             return True
@@ -124,14 +145,16 @@ class SupabaseStorage(PersistentStorageInterface):
         try:
             # Test with a simple query on our actual table
             start_time = datetime.utcnow()
-            result = self.client.table('user_subscriptions').select('count').limit(1).execute()
+            result = await self._exec(
+                self.client.table('user_subscriptions').select('count').limit(1)
+            )
             end_time = datetime.utcnow()
             
             return {
                 "status": "healthy",
                 "response_time_ms": int((end_time - start_time).total_seconds() * 1000),
                 "connection": "ok",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": end_time.isoformat()
             }
             
         except Exception as e:
@@ -142,7 +165,25 @@ class SupabaseStorage(PersistentStorageInterface):
                 "timestamp": datetime.utcnow().isoformat()
             }
     
-    def _set_rls_context(self, user_id: str):
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the pooled HTTP connections"""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        self.client = None
+        self._initialized = False
+    
+    async def _exec(self, query: Any) -> Any:
+        """
+        Execute a supabase-py query in a worker thread.
+        
+        The supabase-py client is synchronous; calling execute() directly
+        inside these coroutines would block the event loop for the whole
+        HTTP round-trip.
+        """
+        return await asyncio.to_thread(query.execute)
+    
+    async def _set_rls_context(self, user_id: str):
         """
         Set Row Level Security context for the current user.
         
@@ -152,11 +193,11 @@ class SupabaseStorage(PersistentStorageInterface):
             raise RuntimeError("Storage not initialized")
         
         # Set the app.user_id setting for RLS policies
-        self.client.rpc('set_config', {
+        await self._exec(self.client.rpc('set_config', {
             'setting_name': 'app.user_id',
             'new_value': user_id,
             'is_local': True
-        }).execute()
+        }))
     
     async def store_journal_entry(
         self,
@@ -165,20 +206,17 @@ class SupabaseStorage(PersistentStorageInterface):
         metadata: Optional[Dict[str, Any]] = None
     ) -> str:
         """Store a trading journal entry"""
-        self._set_rls_context(user_id)
-        
-        entry_id = str(uuid.uuid4())
-        now = datetime.utcnow()
+        await self._set_rls_context(user_id)
         
         try:
-            result = self.client.table('trading_journal').insert({
-                'id': entry_id,
-                'user_id': user_id,
-                'entry': entry,
-                'metadata': json.dumps(metadata or {}),
-                'created_at': now.isoformat(),
-                'updated_at': now.isoformat()
-            }).execute()
+            # journal_insert fills in the id and timestamps from column
+            # defaults and returns the new id in the same round-trip
+            result = await self._exec(self.client.rpc('journal_insert', {
+                'uid': user_id,
+                'e': entry,
+                'm': metadata or {}
+            }))
+            entry_id = str(result.data)
             
             logger.debug(
                 "Journal entry stored",
@@ -202,18 +240,17 @@ class SupabaseStorage(PersistentStorageInterface):
         limit: int = 100,
         offset: int = 0,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        before: Optional[PageCursor] = None
     ) -> List[Dict[str, Any]]:
         """Retrieve journal entries for a user"""
-        self._set_rls_context(user_id)
+        await self._set_rls_context(user_id)
         
         try:
             query = self.client.table('trading_journal')\
                 .select('*')\
-                .eq('user_id', user_id)\
-                .order('created_at', desc=True)\
-                .limit(limit)\
-                .offset(offset)
+                .eq('user_id', user_id)
+            query = self._paginate(query, limit, offset, before)
             
             # Add date filters if provided
             if start_date:
@@ -221,16 +258,18 @@ class SupabaseStorage(PersistentStorageInterface):
             if end_date:
                 query = query.lte('created_at', end_date.isoformat())
             
-            result = query.execute()
+            result = await self._exec(query)
             
             # Process results
             entries = []
             for row in result.data:
                 entry = dict(row)
-                # Parse metadata JSON
-                if entry.get('metadata'):
+                # journal_insert stores metadata as a JSON object; older
+                # rows and update_journal_entry store a serialised string
+                metadata = entry.get('metadata')
+                if metadata and isinstance(metadata, str):
                     try:
-                        entry['metadata'] = json.loads(entry['metadata'])
+                        entry['metadata'] = json.loads(metadata)
                     except json.JSONDecodeError:
                         entry['metadata'] = {}
                 entries.append(entry)
@@ -259,20 +298,20 @@ class SupabaseStorage(PersistentStorageInterface):
         metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Update an existing journal entry"""
-        self._set_rls_context(user_id)
+        await self._set_rls_context(user_id)
         
         try:
-            result = self.client.table('trading_journal')\
+            query = self.client.table('trading_journal')\
                 .update({
                     'entry': entry,
                     'metadata': json.dumps(metadata or {}),
                     'updated_at': datetime.utcnow().isoformat()
-                })\
+                }, count='exact', returning='minimal')\
                 .eq('id', entry_id)\
-                .eq('user_id', user_id)\
-                .execute()
+                .eq('user_id', user_id)
+            result = await self._exec(query)
             
-            success = len(result.data) > 0
+            success = bool(result.count)
             
             logger.debug(
                 "Journal entry update",
@@ -298,16 +337,16 @@ class SupabaseStorage(PersistentStorageInterface):
         entry_id: str
     ) -> bool:
         """Delete a journal entry"""
-        self._set_rls_context(user_id)
+        await self._set_rls_context(user_id)
         
         try:
-            result = self.client.table('trading_journal')\
-                .delete()\
+            query = self.client.table('trading_journal')\
+                .delete(count='exact', returning='minimal')\
                 .eq('id', entry_id)\
-                .eq('user_id', user_id)\
-                .execute()
+                .eq('user_id', user_id)
+            result = await self._exec(query)
             
-            success = len(result.data) > 0
+            success = bool(result.count)
             
             logger.debug(
                 "Journal entry deletion",
@@ -334,20 +373,20 @@ class SupabaseStorage(PersistentStorageInterface):
         value: Any
     ) -> bool:
         """Store a user preference"""
-        self._set_rls_context(user_id)
+        await self._set_rls_context(user_id)
         
         try:
             # Use upsert to handle both insert and update
-            result = self.client.table('user_preferences')\
+            query = self.client.table('user_preferences')\
                 .upsert({
                     'user_id': user_id,
                     'preference_key': key,
                     'preference_value': json.dumps(value),
                     'updated_at': datetime.utcnow().isoformat()
-                })\
-                .execute()
+                }, count='exact', returning='minimal')
+            result = await self._exec(query)
             
-            success = len(result.data) > 0
+            success = bool(result.count)
             
             logger.debug(
                 "User preference stored",
@@ -374,14 +413,14 @@ class SupabaseStorage(PersistentStorageInterface):
         default: Any = None
     ) -> Any:
         """Get a user preference"""
-        self._set_rls_context(user_id)
+        await self._set_rls_context(user_id)
         
         try:
-            result = self.client.table('user_preferences')\
+            query = self.client.table('user_preferences')\
                 .select('preference_value')\
                 .eq('user_id', user_id)\
-                .eq('preference_key', key)\
-                .execute()
+                .eq('preference_key', key)
+            result = await self._exec(query)
             
             if result.data:
                 try:
@@ -405,13 +444,13 @@ class SupabaseStorage(PersistentStorageInterface):
         user_id: str
     ) -> Dict[str, Any]:
         """Get all user preferences"""
-        self._set_rls_context(user_id)
+        await self._set_rls_context(user_id)
         
         try:
-            result = self.client.table('user_preferences')\
+            query = self.client.table('user_preferences')\
                 .select('preference_key, preference_value')\
-                .eq('user_id', user_id)\
-                .execute()
+                .eq('user_id', user_id)
+            result = await self._exec(query)
             
             preferences = {}
             for row in result.data:
@@ -436,20 +475,22 @@ class SupabaseStorage(PersistentStorageInterface):
         record: StorageRecord
     ) -> str:
         """Store a generic record"""
-        self._set_rls_context(record.user_id)
+        await self._set_rls_context(record.user_id)
+        
+        created_at_iso = record.created_at.isoformat()
         
         try:
-            result = self.client.table('storage_records')\
+            query = self.client.table('storage_records')\
                 .insert({
                     'id': record.id,
                     'user_id': record.user_id,
                     'record_type': record.record_type.value,
                     'data': json.dumps(record.data),
                     'metadata': json.dumps(record.metadata or {}),
-                    'created_at': record.created_at.isoformat(),
-                    'updated_at': record.updated_at.isoformat() if record.updated_at else record.created_at.isoformat()
-                })\
-                .execute()
+                    'created_at': created_at_iso,
+                    'updated_at': record.updated_at.isoformat() if record.updated_at else created_at_iso
+                })
+            result = await self._exec(query)
             
             logger.debug(
                 "Generic record stored",
@@ -469,20 +510,67 @@ class SupabaseStorage(PersistentStorageInterface):
             )
             raise
     
+    async def store_records(
+        self,
+        records: List[StorageRecord]
+    ) -> List[str]:
+        """Store generic records with one insert per user"""
+        by_user: Dict[str, List[StorageRecord]] = defaultdict(list)
+        for record in records:
+            by_user[record.user_id].append(record)
+        
+        for user_id, user_records in by_user.items():
+            await self._set_rls_context(user_id)
+            
+            rows = []
+            for record in user_records:
+                created_at_iso = record.created_at.isoformat()
+                rows.append({
+                    'id': record.id,
+                    'user_id': user_id,
+                    'record_type': record.record_type.value,
+                    'data': json.dumps(record.data),
+                    'metadata': json.dumps(record.metadata or {}),
+                    'created_at': created_at_iso,
+                    'updated_at': record.updated_at.isoformat() if record.updated_at else created_at_iso
+                })
+            
+            try:
+                query = self.client.table('storage_records')\
+                    .insert(rows, returning='minimal')
+                await self._exec(query)
+                
+                logger.debug(
+                    "Generic records stored",
+                    user_id_hash=user_id[:8],
+                    count=len(rows)
+                )
+                
+            except Exception as e:
+                logger.error(
+                    "Failed to store generic records",
+                    error=str(e),
+                    user_id_hash=user_id[:8],
+                    count=len(rows)
+                )
+                raise
+        
+        return [record.id for record in records]
+    
     async def get_record(
         self,
         user_id: str,
         record_id: str
     ) -> Optional[StorageRecord]:
         """Get a specific record"""
-        self._set_rls_context(user_id)
+        await self._set_rls_context(user_id)
         
         try:
-            result = self.client.table('storage_records')\
+            query = self.client.table('storage_records')\
                 .select('*')\
                 .eq('id', record_id)\
-                .eq('user_id', user_id)\
-                .execute()
+                .eq('user_id', user_id)
+            result = await self._exec(query)
             
             if not result.data:
                 return None
@@ -505,23 +593,22 @@ class SupabaseStorage(PersistentStorageInterface):
         record_type: Optional[RecordType] = None,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        before: Optional[PageCursor] = None
     ) -> List[StorageRecord]:
         """Query records with filters"""
-        self._set_rls_context(user_id)
+        await self._set_rls_context(user_id)
         
         try:
             query = self.client.table('storage_records')\
                 .select('*')\
-                .eq('user_id', user_id)\
-                .order('created_at', desc=True)\
-                .limit(limit)\
-                .offset(offset)
+                .eq('user_id', user_id)
+            query = self._paginate(query, limit, offset, before)
             
             if record_type:
                 query = query.eq('record_type', record_type.value)
             
-            result = query.execute()
+            result = await self._exec(query)
             
             records = []
             for row in result.data:
@@ -547,20 +634,20 @@ class SupabaseStorage(PersistentStorageInterface):
         metadata: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Update a record"""
-        self._set_rls_context(user_id)
+        await self._set_rls_context(user_id)
         
         try:
-            result = self.client.table('storage_records')\
+            query = self.client.table('storage_records')\
                 .update({
                     'data': json.dumps(data),
                     'metadata': json.dumps(metadata or {}),
                     'updated_at': datetime.utcnow().isoformat()
-                })\
+                }, count='exact', returning='minimal')\
                 .eq('id', record_id)\
-                .eq('user_id', user_id)\
-                .execute()
+                .eq('user_id', user_id)
+            result = await self._exec(query)
             
-            return len(result.data) > 0
+            return bool(result.count)
             
         except Exception as e:
             logger.error(
@@ -577,16 +664,16 @@ class SupabaseStorage(PersistentStorageInterface):
         record_id: str
     ) -> bool:
         """Delete a record"""
-        self._set_rls_context(user_id)
+        await self._set_rls_context(user_id)
         
         try:
-            result = self.client.table('storage_records')\
-                .delete()\
+            query = self.client.table('storage_records')\
+                .delete(count='exact', returning='minimal')\
                 .eq('id', record_id)\
-                .eq('user_id', user_id)\
-                .execute()
+                .eq('user_id', user_id)
+            result = await self._exec(query)
             
-            return len(result.data) > 0
+            return bool(result.count)
             
         except Exception as e:
             logger.error(
@@ -602,31 +689,21 @@ class SupabaseStorage(PersistentStorageInterface):
         user_id: str
     ) -> Dict[str, Any]:
         """Get storage statistics for a user"""
-        self._set_rls_context(user_id)
+        await self._set_rls_context(user_id)
         
         try:
-            # Get journal entry count
-            journal_result = self.client.table('trading_journal')\
-                .select('id', count='exact')\
-                .eq('user_id', user_id)\
-                .execute()
-            
-            # Get preferences count
-            prefs_result = self.client.table('user_preferences')\
-                .select('preference_key', count='exact')\
-                .eq('user_id', user_id)\
-                .execute()
-            
-            # Get generic records count by type
-            records_result = self.client.table('storage_records')\
-                .select('record_type', count='exact')\
-                .eq('user_id', user_id)\
-                .execute()
-            
+            # All three counts come back in a single row from the
+            # storage_stats() SQL function (one round-trip instead of three)
+            result = await self._exec(
+                self.client.rpc('storage_stats', {'uid': user_id})
+            )
+
+            row = result.data[0] if result.data else {}
+
             return {
-                'journal_entries': journal_result.count or 0,
-                'preferences': prefs_result.count or 0,
-                'storage_records': records_result.count or 0,
+                'journal_entries': row.get('journal_entries') or 0,
+                'preferences': row.get('preferences') or 0,
+                'storage_records': row.get('storage_records') or 0,
                 'timestamp': datetime.utcnow().isoformat()
             }
             
@@ -647,12 +724,14 @@ class SupabaseStorage(PersistentStorageInterface):
         
         try:
             # Note: This would typically be done by an admin/system user
-            result = self.client.table('storage_records')\
-                .delete()\
-                .lt('created_at', cutoff_date.isoformat())\
-                .execute()
+            # Ask PostgREST for the affected row count only, rather than
+            # shipping every deleted row back just to len() it
+            query = self.client.table('storage_records')\
+                .delete(count='exact', returning='minimal')\
+                .lt('created_at', cutoff_date.isoformat())
+            result = await self._exec(query)
             
-            count = len(result.data) if result.data else 0
+            count = result.count or 0
             
             logger.info(
                 "Cleaned up expired records",
@@ -669,13 +748,45 @@ class SupabaseStorage(PersistentStorageInterface):
             )
             return 0
     
+    @staticmethod
+    def _paginate(
+        query: Any,
+        limit: int,
+        offset: int,
+        before: Optional[PageCursor]
+    ) -> Any:
+        """
+        Order newest first by (created_at, id) and apply pagination.
+        
+        With a ``before`` cursor this becomes a keyset seek,
+        ``(created_at, id) < (cursor_created_at, cursor_id)``, which the
+        (user_id, created_at DESC) index answers directly regardless of
+        how deep the page is. ``offset`` is only used without a cursor.
+        """
+        query = query\
+            .order('created_at', desc=True)\
+            .order('id', desc=True)\
+            .limit(limit)
+        
+        if before:
+            created_at, row_id = decode_page_cursor(before)
+            ts = created_at.isoformat()
+            query = query.or_(
+                f'created_at.lt."{ts}",'
+                f'and(created_at.eq."{ts}",id.lt."{row_id}")'
+            )
+        elif offset:
+            query = query.offset(offset)
+        
+        return query
+    
     def _row_to_storage_record(self, row: Dict[str, Any]) -> Optional[StorageRecord]:
         """Convert database row to StorageRecord"""
         try:
             return StorageRecord(
                 id=row['id'],
                 user_id=row['user_id'],
-                record_type=RecordType(row['record_type']),
+                record_type=_RECORD_TYPES[row['record_type']],
                 data=json.loads(row['data']) if row['data'] else {},
                 created_at=datetime.fromisoformat(row['created_at']),
                 updated_at=datetime.fromisoformat(row['updated_at']) if row['updated_at'] else None,
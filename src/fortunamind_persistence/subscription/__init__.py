@@ -7,12 +7,15 @@ for FortunaMind services.
 
 from .validator import SubscriptionValidator
 from .tiers import SubscriptionTier, TierLimits
-from .models import SubscriptionData, SubscriptionStatus
+from .models import SubscriptionData, SubscriptionStatus, UsageRecord
+from .usage import UsageRecorder
 
 __all__ = [
     "SubscriptionValidator",
     "SubscriptionTier", 
     "TierLimits",
     "SubscriptionData",
-    "SubscriptionStatus"
+    "SubscriptionStatus",
+    "UsageRecord",
+    "UsageRecorder"
 ]
\ No newline at end of file
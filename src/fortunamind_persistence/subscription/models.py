@@ -4,6 +4,7 @@ Subscription Data Models
 Data structures for subscription management and billing integration.
 """
 
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -11,6 +12,11 @@ from typing import Optional, Dict, Any
 from .tiers import SubscriptionTier
 
 
+_SUBSCRIPTION_KEY_PREFIX = "fm_sub_"
+# Prefix plus at least 13 more characters (20 total); shared with the validator
+_SUBSCRIPTION_KEY_RE = re.compile(rf"{_SUBSCRIPTION_KEY_PREFIX}.{{13,}}", re.DOTALL)
+
+
 class SubscriptionStatus(Enum):
     """Subscription status values"""
     ACTIVE = "active"
@@ -21,7 +27,12 @@ class SubscriptionStatus(Enum):
     PENDING = "pending"
 
 
-@dataclass
+# Pre-bound members for the per-request status checks below
+_ACTIVE = SubscriptionStatus.ACTIVE
+_TRIAL = SubscriptionStatus.TRIAL
+
+
+@dataclass(frozen=True, slots=True)
 class SubscriptionData:
     """
     Complete subscription information for a user.
@@ -47,28 +58,28 @@ class SubscriptionData:
     # Metadata
     metadata: Optional[Dict[str, Any]] = None
     
-    def is_active(self) -> bool:
+    def is_active(self, now: Optional[datetime] = None) -> bool:
         """Check if subscription is currently active"""
         return (
-            self.status == SubscriptionStatus.ACTIVE and
-            self.expires_at > datetime.utcnow()
+            self.status is _ACTIVE and
+            self.expires_at > (now or datetime.utcnow())
         )
     
     def is_trial(self) -> bool:
         """Check if subscription is in trial period"""
-        return self.status == SubscriptionStatus.TRIAL
+        return self.status is _TRIAL
     
-    def days_until_expiry(self) -> int:
+    def days_until_expiry(self, now: Optional[datetime] = None) -> int:
         """Get number of days until expiry (negative if expired)"""
-        delta = self.expires_at - datetime.utcnow()
+        delta = self.expires_at - (now or datetime.utcnow())
         return delta.days
     
-    def is_expiring_soon(self, days: int = 7) -> bool:
+    def is_expiring_soon(self, days: int = 7, now: Optional[datetime] = None) -> bool:
         """Check if subscription is expiring within specified days"""
-        return 0 <= self.days_until_expiry() <= days
+        return 0 <= self.days_until_expiry(now) <= days
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SubscriptionValidationResult:
     """
     Result of subscription validation operation.
@@ -86,7 +97,7 @@ class SubscriptionValidationResult:
     
     def __post_init__(self):
         if self.validation_time is None:
-            self.validation_time = datetime.utcnow()
+            object.__setattr__(self, 'validation_time', datetime.utcnow())
     
     @property
     def tier(self) -> Optional[SubscriptionTier]:
@@ -104,7 +115,7 @@ class SubscriptionValidationResult:
         ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UsageRecord:
     """
     Records API usage for billing and rate limiting.
@@ -118,10 +129,10 @@ class UsageRecord:
     
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
+            object.__setattr__(self, 'timestamp', datetime.utcnow())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BillingEvent:
     """
     Represents a billing-related event from Stripe or other providers.
@@ -138,13 +149,16 @@ class BillingEvent:
     
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.utcnow()
+            object.__setattr__(self, 'timestamp', datetime.utcnow())
 
 
-@dataclass 
+@dataclass(slots=True)
 class SubscriptionKey:
     """
     Represents a subscription key with metadata.
+    
+    Unlike the other models this one stays mutable, since mark_used()
+    updates usage tracking in place.
     """
     key: str
     email: str
@@ -159,11 +173,16 @@ class SubscriptionKey:
     last_used_from_ip: Optional[str] = None
     
     def __post_init__(self):
-        if not self.key.startswith("fm_sub_"):
-            raise ValueError("Subscription key must start with 'fm_sub_'")
-        if len(self.key) < 20:
+        if not _SUBSCRIPTION_KEY_RE.fullmatch(self.key):
+            if not self.key.startswith("fm_sub_"):
+                raise ValueError("Subscription key must start with 'fm_sub_'")
             raise ValueError("Subscription key must be at least 20 characters")
     
+    @staticmethod
+    def is_valid_format(key: str) -> bool:
+        """Check key format without constructing a SubscriptionKey"""
+        return isinstance(key, str) and _SUBSCRIPTION_KEY_RE.fullmatch(key) is not None
+    
     def mark_used(self, ip_address: Optional[str] = None):
         """Mark key as used with optional IP tracking"""
         self.last_used_at = datetime.utcnow()
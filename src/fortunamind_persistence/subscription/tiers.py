@@ -4,9 +4,10 @@ Subscription Tiers and Limits
 Defines subscription tiers, their limits, and feature access for FortunaMind services.
 """
 
+import sys
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 
 class SubscriptionTier(Enum):
@@ -17,7 +18,11 @@ class SubscriptionTier(Enum):
     ENTERPRISE = "enterprise"
 
 
-@dataclass(frozen=True)
+# Value -> member map so string lookups skip EnumMeta.__call__
+_STR_TO_TIER: Dict[str, SubscriptionTier] = {tier.value: tier for tier in SubscriptionTier}
+
+
+@dataclass(frozen=True, slots=True)
 class TierLimits:
     """Limits for a specific subscription tier"""
     # API usage limits
@@ -30,7 +35,7 @@ class TierLimits:
     storage_mb: int       # -1 for unlimited
     
     # Feature access
-    features: Set[str]
+    features: FrozenSet[str]
     
     # Support level
     support_level: str
@@ -44,199 +49,237 @@ class TierLimits:
             raise ValueError("api_calls_per_hour must be positive or -1 for unlimited")
 
 
-class TierDefinitions:
-    """
-    Central definition of all subscription tiers and their limits.
-    
-    This class provides the authoritative source for what each tier includes.
+# Available features
+_FEATURES: FrozenSet[str] = frozenset({
+    # Free features
+    "portfolio_view",
+    "price_check", 
+    "basic_analysis",
+
+    # Premium features
+    "journal_persistence",
+    "historical_analysis", 
+    "performance_metrics",
+    "risk_analysis",
+    "advanced_charts",
+    "export_data",
+    "custom_alerts",
+
+    # Enterprise features
+    "api_access",
+    "bulk_operations",
+    "priority_support",
+    "custom_integrations",
+    "dedicated_account_manager"
+})
+
+# Tier definitions
+_TIERS: Dict[SubscriptionTier, TierLimits] = {
+    SubscriptionTier.FREE: TierLimits(
+        api_calls_per_hour=60,
+        api_calls_per_day=1000,
+        api_calls_per_month=20000,
+        journal_entries=0,  # No persistence
+        storage_mb=0,
+        features=frozenset({
+            "portfolio_view",
+            "price_check", 
+            "basic_analysis"
+        }),
+        support_level="community",
+        burst_limit=10
+    ),
+
+    SubscriptionTier.STARTER: TierLimits(
+        api_calls_per_hour=300,
+        api_calls_per_day=5000,
+        api_calls_per_month=100000,
+        journal_entries=100,
+        storage_mb=50,
+        features=frozenset({
+            "portfolio_view",
+            "price_check",
+            "basic_analysis", 
+            "journal_persistence",
+            "historical_analysis"
+        }),
+        support_level="email",
+        burst_limit=50
+    ),
+
+    SubscriptionTier.PREMIUM: TierLimits(
+        api_calls_per_hour=1000,
+        api_calls_per_day=20000,
+        api_calls_per_month=500000,
+        journal_entries=-1,  # Unlimited
+        storage_mb=1000,
+        features=frozenset({
+            "portfolio_view",
+            "price_check",
+            "basic_analysis",
+            "journal_persistence", 
+            "historical_analysis",
+            "performance_metrics",
+            "risk_analysis",
+            "advanced_charts",
+            "export_data",
+            "custom_alerts"
+        }),
+        support_level="priority_email",
+        burst_limit=100
+    ),
+
+    SubscriptionTier.ENTERPRISE: TierLimits(
+        api_calls_per_hour=-1,  # Unlimited
+        api_calls_per_day=-1,   # Unlimited
+        api_calls_per_month=-1, # Unlimited
+        journal_entries=-1,     # Unlimited
+        storage_mb=-1,          # Unlimited
+        features=_FEATURES,     # All features
+        support_level="phone_and_email",
+        burst_limit=-1          # Unlimited
+    )
+}
+
+
+# One bit per feature, and each tier's features as a mask of those bits, so
+# feature checks are one bit lookup and an AND. Keys are interned so callers
+# passing interned names (e.g. literals) match on identity
+_FEATURE_BIT: Dict[str, int] = {
+    sys.intern(feature): 1 << i for i, feature in enumerate(sorted(_FEATURES))
+}
+_TIER_MASK: Dict[SubscriptionTier, int] = {
+    tier: sum(_FEATURE_BIT[feature] for feature in limits.features)
+    for tier, limits in _TIERS.items()
+}
+
+
+def _rate_limit(limit: int) -> int:
+    """Map the -1 'unlimited' marker to a bound no usage count reaches"""
+    return sys.maxsize if limit == -1 else limit
+
+
+# Per-tier (hour, day, month) API call limits with unlimited already resolved
+_TIER_RATE_LIMITS: Dict[SubscriptionTier, Tuple[int, int, int]] = {
+    tier: (
+        _rate_limit(limits.api_calls_per_hour),
+        _rate_limit(limits.api_calls_per_day),
+        _rate_limit(limits.api_calls_per_month)
+    )
+    for tier, limits in _TIERS.items()
+}
+
+
+# Tier ordering, cheapest first. Compare ranks, not enum values: the values
+# are strings, and "premium" > "starter" is False
+_TIER_RANK: Dict[SubscriptionTier, int] = {
+    SubscriptionTier.FREE: 0,
+    SubscriptionTier.STARTER: 1,
+    SubscriptionTier.PREMIUM: 2,
+    SubscriptionTier.ENTERPRISE: 3
+}
+
+# Cheapest tier that includes each feature
+_MIN_TIER_FOR_FEATURE: Dict[str, SubscriptionTier] = {}
+for _tier in sorted(_TIERS, key=_TIER_RANK.__getitem__):
+    for _feature in _TIERS[_tier].features:
+        _MIN_TIER_FOR_FEATURE.setdefault(_feature, _tier)
+del _tier, _feature
+
+
+# Tier queries. These are plain module functions so hot callers can import
+# them directly; TierDefinitions below exposes the same functions
+def get_tier_limits(tier: SubscriptionTier) -> TierLimits:
+    """Get limits for a subscription tier"""
+    return _TIERS[tier]
+
+
+def get_tier_from_string(tier_str: str) -> Optional[SubscriptionTier]:
+    """Convert string to SubscriptionTier enum"""
+    return _STR_TO_TIER.get(tier_str.lower())
+
+
+def has_feature(tier: SubscriptionTier, feature: str) -> bool:
+    """Check if tier has access to feature"""
+    return bool(_TIER_MASK[tier] & _FEATURE_BIT.get(feature, 0))
+
+
+def has_all_features(tier: SubscriptionTier, features: Iterable[str]) -> bool:
+    """Check if a tier has access to every feature in features"""
+    needed = 0
+    for feature in features:
+        bit = _FEATURE_BIT.get(feature)
+        if bit is None:
+            return False
+        needed |= bit
+    return _TIER_MASK[tier] & needed == needed
+
+
+def can_make_api_call(tier: SubscriptionTier, current_usage: Tuple[int, int, int]) -> bool:
     """
+    Check if user can make an API call based on current usage.
     
-    # Available features
-    FEATURES = {
-        # Free features
-        "portfolio_view",
-        "price_check", 
-        "basic_analysis",
+    Args:
+        tier: User's subscription tier
+        current_usage: (hour, day, month) usage counts
         
-        # Premium features
-        "journal_persistence",
-        "historical_analysis", 
-        "performance_metrics",
-        "risk_analysis",
-        "advanced_charts",
-        "export_data",
-        "custom_alerts",
-        
-        # Enterprise features
-        "api_access",
-        "bulk_operations",
-        "priority_support",
-        "custom_integrations",
-        "dedicated_account_manager"
-    }
-    
-    # Tier definitions
-    TIERS: Dict[SubscriptionTier, TierLimits] = {
-        SubscriptionTier.FREE: TierLimits(
-            api_calls_per_hour=60,
-            api_calls_per_day=1000,
-            api_calls_per_month=20000,
-            journal_entries=0,  # No persistence
-            storage_mb=0,
-            features={
-                "portfolio_view",
-                "price_check", 
-                "basic_analysis"
-            },
-            support_level="community",
-            burst_limit=10
-        ),
-        
-        SubscriptionTier.STARTER: TierLimits(
-            api_calls_per_hour=300,
-            api_calls_per_day=5000,
-            api_calls_per_month=100000,
-            journal_entries=100,
-            storage_mb=50,
-            features={
-                "portfolio_view",
-                "price_check",
-                "basic_analysis", 
-                "journal_persistence",
-                "historical_analysis"
-            },
-            support_level="email",
-            burst_limit=50
-        ),
-        
-        SubscriptionTier.PREMIUM: TierLimits(
-            api_calls_per_hour=1000,
-            api_calls_per_day=20000,
-            api_calls_per_month=500000,
-            journal_entries=-1,  # Unlimited
-            storage_mb=1000,
-            features={
-                "portfolio_view",
-                "price_check",
-                "basic_analysis",
-                "journal_persistence", 
-                "historical_analysis",
-                "performance_metrics",
-                "risk_analysis",
-                "advanced_charts",
-                "export_data",
-                "custom_alerts"
-            },
-            support_level="priority_email",
-            burst_limit=100
-        ),
-        
-        SubscriptionTier.ENTERPRISE: TierLimits(
-            api_calls_per_hour=-1,  # Unlimited
-            api_calls_per_day=-1,   # Unlimited
-            api_calls_per_month=-1, # Unlimited
-            journal_entries=-1,     # Unlimited
-            storage_mb=-1,          # Unlimited
-            features=FEATURES,      # All features
-            support_level="phone_and_email",
-            burst_limit=-1          # Unlimited
-        )
-    }
-    
-    @classmethod
-    def get_limits(cls, tier: SubscriptionTier) -> TierLimits:
-        """Get limits for a specific tier"""
-        return cls.TIERS[tier]
-    
-    @classmethod
-    def get_tier_from_string(cls, tier_str: str) -> Optional[SubscriptionTier]:
-        """Convert string to SubscriptionTier enum"""
-        try:
-            return SubscriptionTier(tier_str.lower())
-        except ValueError:
-            return None
-    
-    @classmethod
-    def has_feature(cls, tier: SubscriptionTier, feature: str) -> bool:
-        """Check if a tier has access to a specific feature"""
-        limits = cls.get_limits(tier)
-        return feature in limits.features
+    Returns:
+        True if user can make the call, False otherwise
+    """
+    hour_limit, day_limit, month_limit = _TIER_RATE_LIMITS[tier]
+    hour, day, month = current_usage
+    return hour < hour_limit and day < day_limit and month < month_limit
+
+
+def can_store_journal_entry(tier: SubscriptionTier, current_entries: int) -> bool:
+    """Check if user can store another journal entry"""
+    journal_entries = _TIERS[tier].journal_entries
     
-    @classmethod
-    def can_make_api_call(cls, tier: SubscriptionTier, current_usage: Dict[str, int]) -> bool:
-        """
-        Check if user can make an API call based on current usage.
-        
-        Args:
-            tier: User's subscription tier
-            current_usage: Dict with 'hour', 'day', 'month' usage counts
-            
-        Returns:
-            True if user can make the call, False otherwise
-        """
-        limits = cls.get_limits(tier)
-        
-        # Check hourly limit
-        if limits.api_calls_per_hour != -1:
-            if current_usage.get('hour', 0) >= limits.api_calls_per_hour:
-                return False
-        
-        # Check daily limit
-        if limits.api_calls_per_day != -1:
-            if current_usage.get('day', 0) >= limits.api_calls_per_day:
-                return False
-        
-        # Check monthly limit
-        if limits.api_calls_per_month != -1:
-            if current_usage.get('month', 0) >= limits.api_calls_per_month:
-                return False
-        
+    # Unlimited storage
+    if journal_entries == -1:
         return True
     
-    @classmethod
-    def can_store_journal_entry(cls, tier: SubscriptionTier, current_entries: int) -> bool:
-        """Check if user can store another journal entry"""
-        limits = cls.get_limits(tier)
-        
-        # Unlimited storage
-        if limits.journal_entries == -1:
-            return True
-        
-        # No storage allowed
-        if limits.journal_entries == 0:
-            return False
-        
-        # Check against limit
-        return current_entries < limits.journal_entries
+    # No storage allowed
+    if journal_entries == 0:
+        return False
     
-    @classmethod
-    def get_upgrade_recommendation(cls, current_tier: SubscriptionTier, needed_feature: str) -> Optional[SubscriptionTier]:
-        """
-        Recommend tier upgrade for a needed feature.
-        
-        Args:
-            current_tier: User's current tier
-            needed_feature: Feature they need
-            
-        Returns:
-            Recommended tier upgrade, None if feature not available
-        """
-        # Check all tiers in order
-        tier_order = [SubscriptionTier.STARTER, SubscriptionTier.PREMIUM, SubscriptionTier.ENTERPRISE]
-        
-        for tier in tier_order:
-            if tier.value > current_tier.value:  # Only consider upgrades
-                if cls.has_feature(tier, needed_feature):
-                    return tier
-        
-        return None
+    # Check against limit
+    return current_entries < journal_entries
 
 
-# Convenience functions
-def get_tier_limits(tier: SubscriptionTier) -> TierLimits:
-    """Get limits for a subscription tier"""
-    return TierDefinitions.get_limits(tier)
+def get_upgrade_recommendation(current_tier: SubscriptionTier, needed_feature: str) -> Optional[SubscriptionTier]:
+    """
+    Recommend tier upgrade for a needed feature.
+    
+    Args:
+        current_tier: User's current tier
+        needed_feature: Feature they need
+        
+    Returns:
+        Recommended tier upgrade, None if feature not available
+    """
+    min_tier = _MIN_TIER_FOR_FEATURE.get(needed_feature)
+    if min_tier is not None and _TIER_RANK[min_tier] > _TIER_RANK[current_tier]:
+        return min_tier
+    return None
 
-def has_feature(tier: SubscriptionTier, feature: str) -> bool:
-    """Check if tier has access to feature"""
-    return TierDefinitions.has_feature(tier, feature)
\ No newline at end of file
+
+class TierDefinitions:
+    """
+    Central definition of all subscription tiers and their limits.
+    
+    This class provides the authoritative source for what each tier includes.
+    It is a namespace over the module-level tables and functions, kept so
+    existing TierDefinitions.<name> callers keep working.
+    """
+    
+    FEATURES = _FEATURES
+    TIERS = _TIERS
+    
+    get_limits = staticmethod(get_tier_limits)
+    get_tier_from_string = staticmethod(get_tier_from_string)
+    has_feature = staticmethod(has_feature)
+    has_all_features = staticmethod(has_all_features)
+    can_make_api_call = staticmethod(can_make_api_call)
+    can_store_journal_entry = staticmethod(can_store_journal_entry)
+    get_upgrade_recommendation = staticmethod(get_upgrade_recommendation)
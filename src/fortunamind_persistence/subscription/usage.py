@@ -0,0 +1,152 @@
+"""
+Usage Recorder
+
+Write-behind recording of API usage. Callers enqueue UsageRecords without
+waiting on the database; a background task flushes them in batches.
+"""
+
+import asyncio
+import uuid
+from typing import List, Optional
+import structlog
+
+from ..storage.interfaces import PersistentStorageInterface, StorageRecord, RecordType
+from .models import UsageRecord
+
+logger = structlog.get_logger(__name__)
+
+
+class UsageRecorder:
+    """
+    Buffers usage records in memory and stores them in batches.
+
+    record() never awaits the database, so it is safe to call on every
+    request. Records are flushed when a batch fills or the flush interval
+    elapses, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        storage: PersistentStorageInterface,
+        max_batch: int = 500,
+        flush_interval: float = 1.0,
+        max_queue: int = 10_000
+    ):
+        """
+        Initialize the usage recorder.
+
+        Args:
+            storage: Storage backend that receives the batches
+            max_batch: Maximum records written per flush
+            flush_interval: Seconds to wait for a batch to fill
+            max_queue: Records buffered before new ones are dropped
+        """
+        self.storage = storage
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self.dropped = 0
+
+    def record(self, usage: UsageRecord) -> bool:
+        """
+        Queue a usage record for storage.
+
+        Returns:
+            False if the buffer is full and the record was dropped
+        """
+        try:
+            self._queue.put_nowait(usage)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(
+                "Usage queue full, record dropped",
+                user_id_hash=usage.user_id[:8],
+                dropped=self.dropped
+            )
+            return False
+
+    def start(self) -> None:
+        """Start the background flusher"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flusher())
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write any buffered records"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._inflight is not None:
+            await self._inflight
+            self._inflight = None
+
+        while not self._queue.empty():
+            await self._write(self._drain(self.max_batch))
+
+    async def _flusher(self) -> None:
+        """Collect records into batches and write them until cancelled"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[UsageRecord] = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.flush_interval
+
+                while len(batch) < self.max_batch:
+                    batch.extend(self._drain(self.max_batch - len(batch)))
+                    remaining = deadline - loop.time()
+                    if len(batch) >= self.max_batch or remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            finally:
+                # Shield the write so stop() cannot cut a batch off half-way;
+                # stop() awaits the in-flight write instead
+                if batch:
+                    self._inflight = asyncio.ensure_future(self._write(batch))
+                    await asyncio.shield(self._inflight)
+                    self._inflight = None
+
+    def _drain(self, limit: int) -> List[UsageRecord]:
+        """Take up to limit records that are already queued"""
+        batch: List[UsageRecord] = []
+        while len(batch) < limit and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _write(self, batch: List[UsageRecord]) -> None:
+        """Store one batch, logging rather than raising on failure"""
+        records = [
+            StorageRecord(
+                id=str(uuid.uuid4()),
+                user_id=usage.user_id,
+                record_type=RecordType.USAGE,
+                data={
+                    'endpoint': usage.endpoint,
+                    'tier': usage.tier.value,
+                    'cost_credits': usage.cost_credits
+                },
+                created_at=usage.timestamp,
+                metadata=usage.metadata
+            )
+            for usage in batch
+        ]
+
+        try:
+            await self.storage.store_records(records)
+            logger.debug("Usage batch stored", count=len(records))
+        except Exception as e:
+            logger.error(
+                "Failed to store usage batch",
+                error=str(e),
+                count=len(records)
+            )
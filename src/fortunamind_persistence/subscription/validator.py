@@ -5,10 +5,15 @@ Validates FortunaMind subscriptions with intelligent caching and database integr
 Provides the core subscription validation logic used across all FortunaMind services.
 """
 
+import functools
+import hashlib
 import time
 import secrets
+import threading
+from collections import OrderedDict
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, cast
 import structlog
 import asyncio
 
@@ -17,71 +22,85 @@ from .models import (
     SubscriptionData, 
     SubscriptionStatus, 
     SubscriptionValidationResult,
-    SubscriptionKey
+    SubscriptionKey,
+    _SUBSCRIPTION_KEY_PREFIX,
+    _SUBSCRIPTION_KEY_RE,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Mock subscriptions started five days ago and run for thirty
+_MOCK_TERM = timedelta(days=30)
+_MOCK_AGE = timedelta(days=5)
+
+# (normalized email, subscription key digest)
+CacheKey = Tuple[str, str]
+
+
+def _norm_email(email: str) -> str:
+    """Lowercase and strip an email, returning it as-is if already normalized"""
+    if email.islower() and email == email.strip():
+        return email
+    return email.lower().strip()
+
+
+def _key_digest(subscription_key: str) -> str:
+    """Digest of a subscription key, so the cache never holds raw keys"""
+    return hashlib.blake2b(subscription_key.encode(), digest_size=16).hexdigest()
+
 
 class SubscriptionCache:
     """
     Intelligent caching system for subscription validation.
     
-    Implements multi-level caching with TTL and automatic cleanup.
+    LRU-bounded with a per-entry TTL; expired entries are dropped when read
+    and the least recently used entry is evicted once the cache is full.
+    
+    Single dict operations are atomic under the GIL, so reads take no lock.
+    Only the multi-step mutations (evicting down to max_size, scanning for
+    invalidation) hold a threading.Lock.
     """
     
-    def __init__(self, ttl_seconds: int = 300):
+    def __init__(self, ttl_seconds: int = 300, max_size: int = 10_000):
         self.ttl = ttl_seconds
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._last_cleanup = time.time()
-        self._cleanup_interval = 600  # 10 minutes
+        self.max_size = max_size
+        # key -> (expiry timestamp, result already flagged as a cache hit)
+        self._cache: OrderedDict[CacheKey, Tuple[float, SubscriptionValidationResult]] = OrderedDict()
+        self._lock = threading.Lock()
     
-    def _cleanup_expired(self):
-        """Remove expired cache entries"""
-        now = time.time()
-        
-        # Only cleanup every 10 minutes
-        if now - self._last_cleanup < self._cleanup_interval:
-            return
-        
-        expired_keys = []
-        for key, entry in self._cache.items():
-            if now - entry['timestamp'] > self.ttl:
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del self._cache[key]
-        
-        self._last_cleanup = now
-        
-        if expired_keys:
-            logger.debug("Cache cleanup", removed_entries=len(expired_keys))
-    
-    def get(self, cache_key: str) -> Optional[SubscriptionValidationResult]:
+    def get(self, cache_key: CacheKey) -> Optional[SubscriptionValidationResult]:
         """Get from cache if valid"""
-        self._cleanup_expired()
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
         
-        if cache_key in self._cache:
-            entry = self._cache[cache_key]
-            if time.time() - entry['timestamp'] < self.ttl:
-                result = entry['result']
-                result.cache_hit = True
-                return result
+        expires_at, result = entry
+        if time.time() < expires_at:
+            try:
+                self._cache.move_to_end(cache_key)
+            except KeyError:
+                pass  # evicted or invalidated since the read; result is still good
+            return result
         
+        self._cache.pop(cache_key, None)
         return None
     
-    def set(self, cache_key: str, result: SubscriptionValidationResult):
+    def set(self, cache_key: CacheKey, result: SubscriptionValidationResult):
         """Update cache"""
-        self._cache[cache_key] = {
-            'result': result,
-            'timestamp': time.time()
-        }
+        entry = (time.time() + self.ttl, replace(result, cache_hit=True))
+        with self._lock:
+            self._cache[cache_key] = entry
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
     
     def invalidate(self, email: str):
         """Invalidate all cache entries for an email"""
-        keys_to_remove = [k for k in self._cache.keys() if k.startswith(f"{email}:")]
-        for key in keys_to_remove:
-            del self._cache[key]
+        with self._lock:
+            # Snapshot the keys in one C-level call: lock-free reads may
+            # reorder the dict (move_to_end) while we scan
+            for key in [k for k in list(self._cache) if k[0] == email]:
+                self._cache.pop(key, None)
         
         logger.debug("Cache invalidated", email_hash=email[:8])
     
@@ -113,7 +132,7 @@ class SubscriptionValidator:
         """
         self.cache = SubscriptionCache(cache_ttl)
         self.db = database_connection
-        self._key_generation_lock = asyncio.Lock()
+        self._in_flight: Dict[CacheKey, asyncio.Future] = {}
         
         logger.info(
             "Subscription validator initialized",
@@ -136,30 +155,64 @@ class SubscriptionValidator:
         Returns:
             SubscriptionValidationResult with validation details
         """
-        if not email or not subscription_key:
-            return SubscriptionValidationResult(
-                is_valid=False,
-                error_message="Email and subscription key are required"
-            )
+        rejected = self._check_input(email, subscription_key)
+        if rejected:
+            return rejected
         
         # Normalize email
-        email = email.lower().strip()
-        
-        # Validate key format
-        if not self._is_valid_key_format(subscription_key):
-            return SubscriptionValidationResult(
-                is_valid=False,
-                error_message="Invalid subscription key format"
-            )
+        email = _norm_email(email)
         
         # Check cache first
-        cache_key = f"{email}:{subscription_key}"
+        cache_key = (email, _key_digest(subscription_key))
+        # Hits are reported through result.cache_hit rather than a log line,
+        # keeping the hottest path free of logging work
         cached_result = self.cache.get(cache_key)
         if cached_result:
-            logger.debug("Cache hit", email_hash=email[:8])
             return cached_result
         
-        # Validate against database
+        return await self._lookup(email, subscription_key, cache_key)
+    
+    async def _lookup(
+        self,
+        email: str,
+        subscription_key: str,
+        cache_key: CacheKey
+    ) -> SubscriptionValidationResult:
+        """Look up a cache miss, sharing one lookup between concurrent callers"""
+        loop = asyncio.get_running_loop()
+        in_flight = self._in_flight.get(cache_key)
+        if in_flight is not None and in_flight.get_loop() is not loop:
+            # Started on another event loop (the shared default validator can
+            # be used from several); it cannot be awaited here
+            in_flight = None
+        if in_flight is not None:
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise  # this caller was cancelled, not the lookup
+                # The lookup's owner was cancelled; do our own below
+        
+        future = loop.create_future()
+        self._in_flight[cache_key] = future
+        try:
+            result = await self._validate_and_cache(email, subscription_key, cache_key)
+            future.set_result(result)
+            return result
+        finally:
+            if self._in_flight.get(cache_key) is future:
+                del self._in_flight[cache_key]
+            if not future.done():
+                future.cancel()
+    
+    async def _validate_and_cache(
+        self,
+        email: str,
+        subscription_key: str,
+        cache_key: CacheKey
+    ) -> SubscriptionValidationResult:
+        """Validate against the database and cache the result"""
+        email_hash = email[:8]
         try:
             result = await self._validate_in_database(email, subscription_key)
             
@@ -168,7 +221,7 @@ class SubscriptionValidator:
             
             logger.debug(
                 "Subscription validated",
-                email_hash=email[:8],
+                email_hash=email_hash,
                 is_valid=result.is_valid,
                 tier=result.tier.value if result.tier else None
             )
@@ -179,13 +232,62 @@ class SubscriptionValidator:
             logger.error(
                 "Subscription validation error",
                 error=str(e),
-                email_hash=email[:8]
+                email_hash=email_hash
             )
             return SubscriptionValidationResult(
                 is_valid=False,
                 error_message=f"Validation error: {str(e)}"
             )
     
+    async def validate_many(
+        self,
+        pairs: List[Tuple[str, str]]
+    ) -> List[SubscriptionValidationResult]:
+        """
+        Validate many subscriptions at once.
+        
+        Cache hits are served directly. Each distinct miss is looked up
+        once, concurrently, and shares any lookup already in flight from
+        validate().
+        
+        Args:
+            pairs: (email, subscription_key) tuples
+            
+        Returns:
+            SubscriptionValidationResults in the same order as pairs
+        """
+        results: List[Optional[SubscriptionValidationResult]] = [None] * len(pairs)
+        misses: Dict[CacheKey, Tuple[str, str]] = {}
+        miss_slots: List[Tuple[int, CacheKey]] = []
+        
+        for i, (email, subscription_key) in enumerate(pairs):
+            rejected = self._check_input(email, subscription_key)
+            if rejected:
+                results[i] = rejected
+                continue
+            
+            email = _norm_email(email)
+            cache_key = (email, _key_digest(subscription_key))
+            cached_result = self.cache.get(cache_key)
+            if cached_result:
+                results[i] = cached_result
+                continue
+            
+            misses.setdefault(cache_key, (email, subscription_key))
+            miss_slots.append((i, cache_key))
+        
+        if misses:
+            looked_up = await asyncio.gather(*(
+                self._lookup(email, subscription_key, cache_key)
+                for cache_key, (email, subscription_key) in misses.items()
+            ))
+            found: Dict[CacheKey, SubscriptionValidationResult] = dict(zip(misses, looked_up))
+            for i, cache_key in miss_slots:
+                results[i] = found[cache_key]
+        
+        # Every slot is filled: rejected, cached or looked up
+        return cast(List[SubscriptionValidationResult], results)
+    
     async def validate_simple(self, email: str, subscription_key: str) -> bool:
         """
         Simple boolean validation for backward compatibility.
@@ -231,28 +333,27 @@ class SubscriptionValidator:
         Returns:
             New subscription key
         """
-        async with self._key_generation_lock:
-            # Generate cryptographically secure key
-            random_part = secrets.token_urlsafe(32)
-            key = f"fm_sub_{random_part}"
-            
-            # Store in database
-            subscription_key = SubscriptionKey(
-                key=key,
-                email=email.lower().strip(),
-                tier=tier,
-                created_at=datetime.utcnow()
-            )
-            
-            await self._store_subscription_key(subscription_key)
-            
-            logger.info(
-                "Subscription key generated", 
-                email_hash=email[:8],
-                tier=tier.value
-            )
-            
-            return key
+        # Generate cryptographically secure key
+        random_part = secrets.token_urlsafe(32)
+        key = f"{_SUBSCRIPTION_KEY_PREFIX}{random_part}"
+        
+        # Store in database
+        subscription_key = SubscriptionKey(
+            key=key,
+            email=_norm_email(email),
+            tier=tier,
+            created_at=datetime.utcnow()
+        )
+        
+        await self._store_subscription_key(subscription_key)
+        
+        logger.info(
+            "Subscription key generated", 
+            email_hash=email[:8],
+            tier=tier.value
+        )
+        
+        return key
     
     def invalidate_cache(self, email: str):
         """
@@ -261,15 +362,31 @@ class SubscriptionValidator:
         Args:
             email: User's email address
         """
-        self.cache.invalidate(email.lower().strip())
+        self.cache.invalidate(_norm_email(email))
+    
+    def _check_input(
+        self,
+        email: str,
+        subscription_key: str
+    ) -> Optional[SubscriptionValidationResult]:
+        """Reject missing or malformed input before any cache or database work"""
+        if not email or not subscription_key:
+            return SubscriptionValidationResult(
+                is_valid=False,
+                error_message="Email and subscription key are required"
+            )
+        
+        if not self._is_valid_key_format(subscription_key):
+            return SubscriptionValidationResult(
+                is_valid=False,
+                error_message="Invalid subscription key format"
+            )
+        
+        return None
     
     def _is_valid_key_format(self, key: str) -> bool:
         """Validate subscription key format"""
-        return (
-            isinstance(key, str) and
-            key.startswith("fm_sub_") and
-            len(key) >= 20
-        )
+        return isinstance(key, str) and _SUBSCRIPTION_KEY_RE.fullmatch(key) is not None
     
     async def _validate_in_database(
         self,
@@ -292,29 +409,36 @@ class SubscriptionValidator:
                 email, subscription_key
             )
             
-            if not subscription:
-                return SubscriptionValidationResult(
-                    is_valid=False,
-                    error_message="Subscription not found"
-                )
-            
-            # Check if subscription is active
-            if not subscription.is_active():
-                return SubscriptionValidationResult(
-                    is_valid=False,
-                    subscription_data=subscription,
-                    error_message=f"Subscription {subscription.status.value}"
-                )
-            
-            return SubscriptionValidationResult(
-                is_valid=True,
-                subscription_data=subscription
-            )
+            return self._result_for_subscription(subscription)
             
         except Exception as e:
             logger.error("Database validation error", error=str(e))
             raise
     
+    def _result_for_subscription(
+        self,
+        subscription: Optional[SubscriptionData]
+    ) -> SubscriptionValidationResult:
+        """Turn a looked-up subscription (or None) into a validation result"""
+        if not subscription:
+            return SubscriptionValidationResult(
+                is_valid=False,
+                error_message="Subscription not found"
+            )
+        
+        # Check if subscription is active
+        if not subscription.is_active():
+            return SubscriptionValidationResult(
+                is_valid=False,
+                subscription_data=subscription,
+                error_message=f"Subscription {subscription.status.value}"
+            )
+        
+        return SubscriptionValidationResult(
+            is_valid=True,
+            subscription_data=subscription
+        )
+    
     async def _mock_validation(
         self,
         email: str,
@@ -325,21 +449,22 @@ class SubscriptionValidator:
         
         Accepts any key starting with 'fm_sub_' as valid premium subscription.
         """
-        if not subscription_key.startswith("fm_sub_"):
+        if not subscription_key.startswith(_SUBSCRIPTION_KEY_PREFIX):
             return SubscriptionValidationResult(
                 is_valid=False,
                 error_message="Invalid key format"
             )
         
         # Create mock subscription data
+        now = datetime.utcnow()
         mock_subscription = SubscriptionData(
             email=email,
             subscription_key=subscription_key,
             tier=SubscriptionTier.PREMIUM,
             status=SubscriptionStatus.ACTIVE,
-            expires_at=datetime.utcnow() + timedelta(days=30),
-            created_at=datetime.utcnow() - timedelta(days=5),
-            updated_at=datetime.utcnow(),
+            expires_at=now + _MOCK_TERM,
+            created_at=now - _MOCK_AGE,
+            updated_at=now,
             metadata={"mock": True}
         )
         
@@ -347,7 +472,8 @@ class SubscriptionValidator:
         
         return SubscriptionValidationResult(
             is_valid=True,
-            subscription_data=mock_subscription
+            subscription_data=mock_subscription,
+            validation_time=now
         )
     
     async def _get_subscription_from_database(self, email: str) -> Optional[SubscriptionData]:
@@ -374,13 +500,17 @@ class SubscriptionValidator:
 
 
 # Convenience functions for backward compatibility
-_default_validator = None
+@functools.cache
+def _get_default_validator() -> SubscriptionValidator:
+    """
+    Shared validator for the module-level convenience functions
+    
+    It may be used from several event loops; in-flight lookups started on
+    another loop are not shared (see _lookup).
+    """
+    return SubscriptionValidator()
+
 
 async def validate_subscription(email: str, subscription_key: str) -> bool:
     """Global convenience function for subscription validation"""
-    global _default_validator
-    
-    if _default_validator is None:
-        _default_validator = SubscriptionValidator()
-    
-    return await _default_validator.validate_simple(email, subscription_key)
\ No newline at end of file
+    return await _get_default_validator().validate_simple(email, subscription_key)
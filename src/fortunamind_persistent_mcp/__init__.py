@@ -14,7 +14,7 @@ __email__ = "dev@fortunamind.com"
 
 # Main exports for clean package interface
 from .main import main
-from .config import get_settings, Settings
+from .config import get_settings, reset_settings, Settings
 
 try:
     from .persistent_mcp.server import PersistentMCPServer
@@ -25,6 +25,7 @@ except ImportError:
 __all__ = [
     "main", 
     "get_settings", 
+    "reset_settings",
     "Settings", 
     "PersistentMCPServer",
     "__version__",
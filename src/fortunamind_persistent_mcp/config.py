@@ -4,28 +4,36 @@ Configuration management for FortunaMind Persistent MCP Server.
 Handles all environment variables, settings, and configuration validation.
 """
 
+import functools
 import os
-from enum import Enum
-from typing import List, Optional
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from enum import StrEnum
+from pathlib import Path
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, FrozenSet, Mapping, Optional, Tuple
+from pydantic import AliasChoices, Field
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
 
-class Environment(str, Enum):
+class Environment(StrEnum):
     """Environment types"""
     DEVELOPMENT = "development"
     STAGING = "staging"
     PRODUCTION = "production"
 
 
-class SecurityProfile(str, Enum):
+class SecurityProfile(StrEnum):
     """Security scanner profiles"""
     STRICT = "STRICT"
     MODERATE = "MODERATE"
     LENIENT = "LENIENT"
 
 
-class LogLevel(str, Enum):
+class LogLevel(StrEnum):
     """Logging levels"""
     DEBUG = "DEBUG"
     INFO = "INFO"
@@ -34,12 +42,93 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
-class LogFormat(str, Enum):
+class LogFormat(StrEnum):
     """Log output formats"""
     JSON = "json"
     TEXT = "text"
 
 
+# Shared constraint types, so identical bounds reuse one definition
+PositiveInt = Annotated[int, Field(ge=1)]
+NonNegativeInt = Annotated[int, Field(ge=0)]
+Port = Annotated[int, Field(ge=1, le=65535)]
+
+
+# Security scanner settings per profile, built once; read-only so callers
+# can share them without copying
+_SECURITY_PROFILES: Mapping[SecurityProfile, Mapping[str, Any]] = MappingProxyType({
+    SecurityProfile.STRICT: MappingProxyType({
+        "enable_api_detection": True,
+        "enable_injection_detection": True,
+        "enable_pii_detection": True,
+        "sensitivity": "high",
+        "auto_sanitize": True,
+        "block_on_medium": True,
+        "log_all_attempts": True
+    }),
+    SecurityProfile.MODERATE: MappingProxyType({
+        "enable_api_detection": True,
+        "enable_injection_detection": True,
+        "enable_pii_detection": False,
+        "sensitivity": "medium",
+        "auto_sanitize": True,
+        "block_on_high": True,
+        "log_critical_only": True
+    }),
+    SecurityProfile.LENIENT: MappingProxyType({
+        "enable_api_detection": True,
+        "enable_injection_detection": False,
+        "enable_pii_detection": False,
+        "sensitivity": "low",
+        "auto_sanitize": False,
+        "block_on_critical": True,
+        "log_critical_only": True
+    })
+})
+
+
+# Production deploys (Render) set real environment variables and ship no
+# .env, so skip the dotenv lookup there entirely
+_ENV_FILE: Optional[str] = (
+    None if os.environ.get("ENVIRONMENT", "").lower() == Environment.PRODUCTION else ".env"
+)
+
+# Parsed .env files: resolved path -> (mtime_ns, values)
+_DOTENV_CACHE: Dict[str, Tuple[int, Mapping[str, Optional[str]]]] = {}
+
+
+class _CachedDotEnvSettingsSource(DotEnvSettingsSource):
+    """.env source that re-parses a file only when its mtime changes"""
+
+    def _read_env_file(self, file_path: Path) -> Mapping[str, Optional[str]]:
+        path = str(file_path.resolve())
+        mtime_ns = file_path.stat().st_mtime_ns
+        cached = _DOTENV_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        values = super()._read_env_file(file_path)
+        _DOTENV_CACHE[path] = (mtime_ns, values)
+        return values
+
+
+@functools.lru_cache(maxsize=8)
+def _symbol_set(symbols: Tuple[str, ...]) -> FrozenSet[str]:
+    """Set form of a supported_symbols tuple, keyed on the tuple itself"""
+    return frozenset(symbols)
+
+
+@functools.lru_cache(maxsize=8)
+def _db_config(pool_size: int, max_overflow: int, pool_timeout: int) -> Mapping[str, Any]:
+    """Read-only SQLAlchemy pool config, shared by Settings with equal pool fields"""
+    return MappingProxyType({
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": pool_timeout,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,  # 1 hour
+    })
+
+
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
@@ -84,11 +173,10 @@ class Settings(BaseSettings):
         description="Server mode - 'stdio' or 'http'"
     )
     
-    server_port: int = Field(
-        default_factory=lambda: int(os.environ.get("PORT", "8080")),
-        ge=1,
-        le=65535,
-        description="Server bind port (reads from PORT env var for Render)"
+    server_port: Port = Field(
+        default=8080,
+        validation_alias=AliasChoices("server_port", "PORT"),
+        description="Server bind port (falls back to the PORT env var for Render)"
     )
     
     environment: Environment = Field(
@@ -108,15 +196,13 @@ class Settings(BaseSettings):
         description="JWT signing algorithm"
     )
     
-    jwt_access_token_expire_minutes: int = Field(
+    jwt_access_token_expire_minutes: PositiveInt = Field(
         default=30,
-        ge=1,
         description="Access token expiration in minutes"
     )
     
-    jwt_refresh_token_expire_days: int = Field(
+    jwt_refresh_token_expire_days: PositiveInt = Field(
         default=7,
-        ge=1,
         description="Refresh token expiration in days"
     )
     
@@ -125,9 +211,8 @@ class Settings(BaseSettings):
         description="Security scanner sensitivity profile"
     )
     
-    api_rate_limit_per_minute: int = Field(
+    api_rate_limit_per_minute: PositiveInt = Field(
         default=60,
-        ge=1,
         description="API requests per minute limit"
     )
     
@@ -149,27 +234,24 @@ class Settings(BaseSettings):
         description="Subscription API authentication key"
     )
     
-    subscription_cache_ttl_minutes: int = Field(
+    subscription_cache_ttl_minutes: PositiveInt = Field(
         default=5,
-        ge=1,
         description="Subscription status cache TTL"
     )
     
-    subscription_grace_period_days: int = Field(
+    subscription_grace_period_days: NonNegativeInt = Field(
         default=7,
-        ge=0,
         description="Grace period after subscription expires"
     )
     
     # ===== TECHNICAL INDICATORS =====
-    technical_indicators_cache_ttl_minutes: int = Field(
+    technical_indicators_cache_ttl_minutes: PositiveInt = Field(
         default=5,
-        ge=1,
         description="Technical indicators cache TTL"
     )
     
-    supported_symbols: List[str] = Field(
-        default=["BTC", "ETH", "LTC", "BCH", "ADA", "SOL", "MATIC", "DOT", "AVAX", "UNI"],
+    supported_symbols: Tuple[str, ...] = Field(
+        default=("BTC", "ETH", "LTC", "BCH", "ADA", "SOL", "MATIC", "DOT", "AVAX", "UNI"),
         description="Supported cryptocurrency symbols"
     )
     
@@ -180,31 +262,28 @@ class Settings(BaseSettings):
         description="Default RSI calculation period"
     )
     
-    default_sma_periods: List[int] = Field(
-        default=[20, 50, 200],
+    default_sma_periods: Tuple[int, ...] = Field(
+        default=(20, 50, 200),
         description="Default SMA periods"
     )
     
-    default_ema_periods: List[int] = Field(
-        default=[12, 26],
+    default_ema_periods: Tuple[int, ...] = Field(
+        default=(12, 26),
         description="Default EMA periods"  
     )
     
-    default_macd_fast: int = Field(
+    default_macd_fast: PositiveInt = Field(
         default=12,
-        ge=1,
         description="MACD fast period"
     )
     
-    default_macd_slow: int = Field(
+    default_macd_slow: PositiveInt = Field(
         default=26,
-        ge=1,
         description="MACD slow period"
     )
     
-    default_macd_signal: int = Field(
+    default_macd_signal: PositiveInt = Field(
         default=9,
-        ge=1,
         description="MACD signal period"
     )
     
@@ -224,15 +303,13 @@ class Settings(BaseSettings):
         description="Log file path (None for stdout only)"
     )
     
-    log_max_size_mb: int = Field(
+    log_max_size_mb: PositiveInt = Field(
         default=100,
-        ge=1,
         description="Maximum log file size in MB"
     )
     
-    log_backup_count: int = Field(
+    log_backup_count: NonNegativeInt = Field(
         default=5,
-        ge=0,
         description="Number of log backup files to keep"
     )
     
@@ -242,10 +319,8 @@ class Settings(BaseSettings):
         description="Enable Prometheus metrics"
     )
     
-    metrics_port: int = Field(
+    metrics_port: Port = Field(
         default=9090,
-        ge=1,
-        le=65535,
         description="Metrics server port"
     )
     
@@ -308,27 +383,23 @@ class Settings(BaseSettings):
     )
     
     # ===== PERFORMANCE CONFIGURATION =====
-    db_pool_size: int = Field(
+    db_pool_size: PositiveInt = Field(
         default=10,
-        ge=1,
         description="Database connection pool size"
     )
     
-    db_max_overflow: int = Field(
+    db_max_overflow: NonNegativeInt = Field(
         default=20,
-        ge=0,
         description="Database connection pool overflow"
     )
     
-    db_pool_timeout: int = Field(
+    db_pool_timeout: PositiveInt = Field(
         default=30,
-        ge=1,
         description="Database connection timeout seconds"
     )
     
-    http_timeout_seconds: int = Field(
+    http_timeout_seconds: PositiveInt = Field(
         default=30,
-        ge=1,
         description="HTTP client timeout"
     )
     
@@ -345,9 +416,8 @@ class Settings(BaseSettings):
         description="HTTP retry backoff multiplier"
     )
     
-    cache_default_ttl_seconds: int = Field(
+    cache_default_ttl_seconds: PositiveInt = Field(
         default=300,
-        ge=1,
         description="Default cache TTL in seconds"
     )
     
@@ -357,67 +427,81 @@ class Settings(BaseSettings):
         description="Redis connection URL (optional)"
     )
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    # Settings are read-only once loaded; use model_copy(update=...) to
+    # derive a variant
+    model_config = SettingsConfigDict(
+        env_file=_ENV_FILE,
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True
+    )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Swap in the mtime-cached .env source; precedence is unchanged"""
+        # Copy from the source pydantic built so per-instance overrides such
+        # as Settings(_env_file=...) still apply
+        if isinstance(dotenv_settings, DotEnvSettingsSource):
+            dotenv_settings = _CachedDotEnvSettingsSource(
+                settings_cls,
+                env_file=dotenv_settings.env_file,
+                env_file_encoding=dotenv_settings.env_file_encoding,
+                case_sensitive=dotenv_settings.case_sensitive,
+                env_prefix=dotenv_settings.env_prefix,
+            )
+        return init_settings, env_settings, dotenv_settings, file_secret_settings
+
+    @property
+    def supported_symbols_set(self) -> FrozenSet[str]:
+        """supported_symbols as a set, for O(1) membership checks"""
+        return _symbol_set(self.supported_symbols)
+
+    def supports_symbol(self, symbol: str) -> bool:
+        """Check whether a symbol is in supported_symbols"""
+        return symbol in self.supported_symbols_set
+
+    @property
     def is_development(self) -> bool:
         """Check if running in development mode"""
-        return self.environment == Environment.DEVELOPMENT
+        return self.environment is Environment.DEVELOPMENT
 
+    @property
     def is_production(self) -> bool:
         """Check if running in production mode"""
-        return self.environment == Environment.PRODUCTION
+        return self.environment is Environment.PRODUCTION
+
+    @property
+    def db_config(self) -> Mapping[str, Any]:
+        """Database configuration for SQLAlchemy, read-only"""
+        return _db_config(self.db_pool_size, self.db_max_overflow, self.db_pool_timeout)
 
     def get_db_config(self) -> dict:
-        """Get database configuration for SQLAlchemy"""
-        return {
-            "pool_size": self.db_pool_size,
-            "max_overflow": self.db_max_overflow,
-            "pool_timeout": self.db_pool_timeout,
-            "pool_pre_ping": True,
-            "pool_recycle": 3600,  # 1 hour
-        }
+        """Get database configuration for SQLAlchemy as a mutable copy"""
+        return dict(self.db_config)
 
     def get_security_config(self) -> dict:
         """Get security scanner configuration"""
-        profiles = {
-            SecurityProfile.STRICT: {
-                "enable_api_detection": True,
-                "enable_injection_detection": True,
-                "enable_pii_detection": True,
-                "sensitivity": "high",
-                "auto_sanitize": True,
-                "block_on_medium": True,
-                "log_all_attempts": True
-            },
-            SecurityProfile.MODERATE: {
-                "enable_api_detection": True,
-                "enable_injection_detection": True,
-                "enable_pii_detection": False,
-                "sensitivity": "medium",
-                "auto_sanitize": True,
-                "block_on_high": True,
-                "log_critical_only": True
-            },
-            SecurityProfile.LENIENT: {
-                "enable_api_detection": True,
-                "enable_injection_detection": False,
-                "enable_pii_detection": False,
-                "sensitivity": "low",
-                "auto_sanitize": False,
-                "block_on_critical": True,
-                "log_critical_only": True
-            }
-        }
-        return profiles[self.security_profile]
-
-
-# Global settings instance
-settings = Settings()
+        return dict(_SECURITY_PROFILES[self.security_profile])
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings"""
-    return settings
\ No newline at end of file
+    """
+    Get application settings.
+    
+    Settings are loaded on first call rather than at import, so importing
+    this module does not read .env or validate every field.
+    """
+    return Settings()
+
+
+def reset_settings() -> None:
+    """Drop the cached Settings so the next get_settings() reloads them"""
+    get_settings.cache_clear()
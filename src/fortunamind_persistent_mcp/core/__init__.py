@@ -5,15 +5,18 @@ Provides mock implementations of framework classes for development
 when the FortunaMind framework is not available.
 """
 
-from .mock import (
-    ToolRegistry,
-    AuthContext, 
-    ToolResult,
-    ToolSchema,
-    ReadOnlyTool,
-    WriteEnabledTool,
-    UnifiedPricesTool
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .mock import (
+        ToolRegistry,
+        AuthContext,
+        ToolResult,
+        ToolSchema,
+        ReadOnlyTool,
+        WriteEnabledTool,
+        UnifiedPricesTool
+    )
 
 __all__ = [
     "ToolRegistry",
@@ -23,4 +26,12 @@ __all__ = [
     "ReadOnlyTool",
     "WriteEnabledTool",
     "UnifiedPricesTool"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve exports through .mock on first use so the framework import stays lazy"""
+    if name in __all__:
+        from . import mock
+        return getattr(mock, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
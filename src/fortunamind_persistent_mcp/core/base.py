@@ -5,10 +5,16 @@ Provides comprehensive base classes for tools, services, and components
 to reduce code duplication and ensure consistent patterns across the application.
 """
 
+import asyncio
+import functools
+import itertools
 import logging
+import reprlib
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union, Type
+from collections import OrderedDict
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Coroutine, Dict, List, Optional, Any, Set, Tuple, Union, Type
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
@@ -21,11 +27,34 @@ except ImportError:
     from .mock import AuthContext, ToolResult, ToolSchema, ReadOnlyTool as FrameworkReadOnlyTool, WriteEnabledTool as FrameworkWriteEnabledTool
     FRAMEWORK_AVAILABLE = False
 
-from fortunamind_persistent_mcp.config import Settings
+from fortunamind_persistent_mcp.config import SecurityProfile, Settings
 from .security import SecurityScanner, SecurityThreat, ThreatLevel
 
+if TYPE_CHECKING:
+    from fortunamind_persistent_mcp.persistent_mcp.storage.interface import StorageInterface
+
 logger = logging.getLogger(__name__)
 
+# Parameters expected to carry credentials; not scanned for threats
+_CREDENTIAL_KEYS = frozenset({"api_key", "api_secret", "private_key", "secret", "token"})
+
+# Scanner sensitivity for each configured security profile
+_SCANNER_SENSITIVITY = {profile: profile.value.upper() for profile in SecurityProfile}
+
+# Threat levels that reject a tool call
+_BLOCKING_THREAT_LEVELS = frozenset({ThreatLevel.CRITICAL, ThreatLevel.HIGH})
+
+# Scannable parameter size (characters) above which the security scan runs
+# in a worker thread
+_THREADED_SCAN_THRESHOLD = 32 * 1024
+
+# Executions kept per tool for get_execution_metrics
+_MAX_EXECUTION_METRICS = 100
+
+# Execution id sequence; starting from the process start time in ms keeps
+# the old "<tool>_<millis>" shape while never repeating within a process
+_EXECUTION_IDS = itertools.count(int(time.time() * 1000))
+
 
 class ToolCategory(str, Enum):
     """Tool categories for organization"""
@@ -44,7 +73,7 @@ class Permission(str, Enum):
     ADMIN = "admin"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """Parameter validation error"""
     field: str
@@ -52,18 +81,361 @@ class ValidationError:
     code: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionContext:
     """Enhanced execution context with metrics and validation"""
     auth_context: Optional[AuthContext]
     parameters: Dict[str, Any]
-    start_time: datetime
+    start_time: float  # time.perf_counter() reading, not wall-clock time
     execution_id: str
     user_id_hash: Optional[str] = None
     
     def get_execution_time(self) -> float:
         """Get execution time in seconds"""
-        return (datetime.now() - self.start_time).total_seconds()
+        return time.perf_counter() - self.start_time
+
+
+def _scannable_size(parameters: Dict[str, Any]) -> int:
+    """Total length of the string parameters the security scan would read"""
+    return sum(len(value) for value in parameters.values() if isinstance(value, str))
+
+
+ParameterValidator = Callable[[Dict[str, Any]], List[ValidationError]]
+FieldCheck = Callable[[Any], Optional[ValidationError]]
+
+# JSON-schema type name -> (accepted Python types, article + name for messages)
+_TYPE_CHECKS: Dict[str, Tuple[Union[type, Tuple[type, ...]], str]] = {
+    "string": (str, "a string"),
+    "integer": (int, "an integer"),
+    "number": ((int, float), "a number"),
+    "boolean": (bool, "a boolean"),
+}
+
+
+def _compile_field_checks(field: str, field_spec: Dict[str, Any]) -> List[FieldCheck]:
+    """Turn one property spec into the list of checks that apply to it"""
+    checks: List[FieldCheck] = []
+    field_type = field_spec.get("type")
+
+    # Type validation
+    if field_type in _TYPE_CHECKS:
+        expected, type_name = _TYPE_CHECKS[field_type]
+        type_message = f"Field '{field}' must be {type_name}"
+
+        def check_type(value: Any) -> Optional[ValidationError]:
+            if not isinstance(value, expected):
+                return ValidationError(field=field, message=type_message, code="INVALID_TYPE")
+            return None
+        checks.append(check_type)
+
+    # Enum validation
+    enum_values = field_spec.get("enum")
+    if enum_values:
+        enum_message = f"Field '{field}' must be one of: {', '.join(map(str, enum_values))}"
+
+        def check_enum(value: Any) -> Optional[ValidationError]:
+            if value not in enum_values:
+                return ValidationError(field=field, message=enum_message, code="INVALID_ENUM_VALUE")
+            return None
+        checks.append(check_enum)
+
+    # String length validation
+    if field_type == "string":
+        min_length = field_spec.get("minLength")
+        max_length = field_spec.get("maxLength")
+
+        if min_length:
+            short_message = f"Field '{field}' must be at least {min_length} characters"
+
+            def check_min_length(value: Any) -> Optional[ValidationError]:
+                if isinstance(value, str) and len(value) < min_length:
+                    return ValidationError(field=field, message=short_message, code="STRING_TOO_SHORT")
+                return None
+            checks.append(check_min_length)
+
+        if max_length:
+            long_message = f"Field '{field}' must be at most {max_length} characters"
+
+            def check_max_length(value: Any) -> Optional[ValidationError]:
+                if isinstance(value, str) and len(value) > max_length:
+                    return ValidationError(field=field, message=long_message, code="STRING_TOO_LONG")
+                return None
+            checks.append(check_max_length)
+
+    # Number range validation
+    if field_type in ("number", "integer"):
+        minimum = field_spec.get("minimum")
+        maximum = field_spec.get("maximum")
+
+        if minimum is not None:
+            small_message = f"Field '{field}' must be at least {minimum}"
+
+            def check_minimum(value: Any) -> Optional[ValidationError]:
+                if isinstance(value, (int, float)) and value < minimum:
+                    return ValidationError(field=field, message=small_message, code="NUMBER_TOO_SMALL")
+                return None
+            checks.append(check_minimum)
+
+        if maximum is not None:
+            large_message = f"Field '{field}' must be at most {maximum}"
+
+            def check_maximum(value: Any) -> Optional[ValidationError]:
+                if isinstance(value, (int, float)) and value > maximum:
+                    return ValidationError(field=field, message=large_message, code="NUMBER_TOO_LARGE")
+                return None
+            checks.append(check_maximum)
+
+    return checks
+
+
+def _accept_all_parameters(parameters: Dict[str, Any]) -> List[ValidationError]:
+    """Validator for schemas that place no constraints on parameters"""
+    return []
+
+
+def compile_parameter_validator(schema_params: Any) -> ParameterValidator:
+    """
+    Compile a tool's parameter schema into a validation function
+
+    The schema is interpreted once here; the returned function only runs
+    the checks that apply to each field.
+
+    Args:
+        schema_params: JSON-schema style parameter definition
+
+    Returns:
+        Function mapping parameters to a list of validation errors
+    """
+    if not isinstance(schema_params, dict) or "properties" not in schema_params:
+        return _accept_all_parameters
+
+    required_fields = tuple(schema_params.get("required", []))
+    field_checks = {
+        field: checks
+        for field, field_spec in schema_params.get("properties", {}).items()
+        if (checks := _compile_field_checks(field, field_spec))
+    }
+
+    # Nothing required and nothing to check: skip the per-call loop entirely
+    if not required_fields and not field_checks:
+        return _accept_all_parameters
+
+    def validate(parameters: Dict[str, Any]) -> List[ValidationError]:
+        # Check required fields
+        errors = [
+            ValidationError(
+                field=field,
+                message=f"Required field '{field}' is missing",
+                code="MISSING_REQUIRED_FIELD"
+            )
+            for field in required_fields
+            if parameters.get(field) is None
+        ]
+
+        # Validate field types and constraints
+        for field, value in parameters.items():
+            checks = field_checks.get(field)
+            if checks is None or value is None:
+                continue
+            for check in checks:
+                error = check(value)
+                if error is not None:
+                    errors.append(error)
+
+        return errors
+
+    return validate
+
+
+@dataclass(frozen=True, slots=True)
+class _SchemaInfo:
+    """What execute() needs from a tool's schema, computed once per class"""
+    name: str
+    category: Optional[str]
+    validator: ParameterValidator
+
+
+# Educational content library for _generate_educational_content, built once
+_CONTENT_LIBRARY: Dict[str, Dict[str, str]] = {
+    "crypto_basics": {
+        "title": "Understanding Cryptocurrency",
+        "content": """
+Cryptocurrency is digital money secured by cryptography. Unlike traditional currency, 
+it's decentralized - meaning no single authority (like a bank) controls it.
+
+Key concepts:
+• **Blockchain**: The technology that records all transactions
+• **Volatility**: Crypto prices can change dramatically
+• **Market Cap**: The total value of a cryptocurrency
+• **Liquidity**: How easily you can buy/sell without affecting price
+        """.strip()
+    },
+    
+    "portfolio_management": {
+        "title": "Smart Portfolio Management", 
+        "content": """
+A crypto portfolio is your collection of different cryptocurrencies. Smart management principles:
+
+• **Diversification**: Don't put all money in one crypto
+• **Position Sizing**: Only invest what you can afford to lose
+• **Risk Management**: Set limits on losses
+• **Regular Review**: Check performance and rebalance if needed
+• **Long-term Thinking**: Avoid emotional day-trading
+        """.strip()
+    },
+    
+    "technical_analysis": {
+        "title": "Technical Analysis Basics",
+        "content": """
+Technical analysis uses price charts and patterns to predict future movements. 
+
+Important principles:
+• **No Crystal Ball**: Indicators show possibilities, not certainties
+• **Multiple Confirmation**: Use several indicators together
+• **Market Context**: Consider overall market conditions
+• **Risk Management**: Always have exit strategies
+• **Practice**: Start with small amounts while learning
+        """.strip()
+    },
+    
+    "risk_management": {
+        "title": "Managing Investment Risk",
+        "content": """
+Risk management is protecting your investment capital. Key strategies:
+
+• **Stop Losses**: Set prices where you'll sell to limit losses
+• **Position Sizing**: Never risk more than 1-5% on a single trade
+• **Diversification**: Spread risk across different assets
+• **Emotional Control**: Don't panic buy/sell
+• **Emergency Fund**: Keep some cash available for opportunities
+        """.strip()
+    }
+}
+
+_DEFAULT_CONTENT: Dict[str, str] = {
+    "title": "Investment Guidance",
+    "content": "Remember: Do your own research, never invest more than you can afford to lose, and consider your risk tolerance."
+}
+
+
+# Bounded repr for result summaries; containers are truncated while being
+# formatted instead of formatting everything and slicing afterwards
+_SUMMARY_REPR = reprlib.Repr()
+_SUMMARY_REPR.maxstring = 200
+_SUMMARY_REPR.maxother = 200
+
+
+@functools.singledispatch
+def summarize_result(result: Any) -> Dict[str, Any]:
+    """Summarize a tool result for history storage, dispatching on its type"""
+    return {
+        "type": type(result).__name__,
+        "summary": _SUMMARY_REPR.repr(result)[:200]
+    }
+
+
+@summarize_result.register
+def _(result: str) -> Dict[str, Any]:
+    return {
+        "type": "str",
+        "summary": result[:200]  # Truncate long strings
+    }
+
+
+@summarize_result.register
+def _(result: dict) -> Dict[str, Any]:
+    return {
+        "type": "dict",
+        "keys": list(islice(result, 10)),  # Limit to prevent large storage
+        "size": len(result)
+    }
+
+
+@summarize_result.register
+def _(result: list) -> Dict[str, Any]:
+    return {
+        "type": "list",
+        "length": len(result),
+        "sample": result[:3]
+    }
+
+
+class _HistoryBatcher:
+    """
+    Buffers execution history records for one storage backend
+
+    Records are written with a single store_records call once max_batch
+    records are waiting or flush_interval seconds after the first one,
+    whichever comes first.
+    """
+
+    def __init__(self, storage: "StorageInterface", max_batch: int = 64, flush_interval: float = 0.25):
+        self.storage = storage
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._pending: List[Any] = []
+        self._timer: Optional[asyncio.Task] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def submit(self, record: Any) -> None:
+        """Queue a record; must be called from a running event loop"""
+        self._pending.append(record)
+        if len(self._pending) >= self.max_batch:
+            self._spawn(self._drain())
+        elif self._timer is None or self._timer.done():
+            self._timer = self._spawn(self._flush_later())
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        # Keep a reference so pending flushes are not garbage collected
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        # Write in a separate task so cancelling the timer never interrupts
+        # a store_records call
+        self._spawn(self._drain())
+
+    async def flush(self) -> None:
+        """Write everything queued so far and wait for in-flight writes"""
+        if self._timer is not None:
+            self._timer.cancel()
+        # Batches already taken by background writes are only on storage
+        # once those tasks finish
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._drain()
+
+    async def _drain(self) -> None:
+        while self._pending:
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            try:
+                await self.storage.store_records(batch)
+            except Exception as e:
+                logger.warning(f"Failed to store {len(batch)} execution history records: {e}")
+
+
+# One history batcher per storage backend, shared by every tool using it
+_HISTORY_BATCHERS: Dict["StorageInterface", _HistoryBatcher] = {}
+
+
+def _history_batcher(storage: "StorageInterface") -> _HistoryBatcher:
+    """Get the history batcher for a storage backend, creating it if needed"""
+    batcher = _HISTORY_BATCHERS.get(storage)
+    if batcher is None:
+        batcher = _HISTORY_BATCHERS[storage] = _HistoryBatcher(storage)
+    return batcher
+
+
+async def flush_execution_history() -> None:
+    """Write any buffered execution history; call before closing storage"""
+    # Drop the batchers as they are flushed so closed storage backends are
+    # not kept alive; a later submit starts a fresh one
+    while _HISTORY_BATCHERS:
+        _, batcher = _HISTORY_BATCHERS.popitem()
+        await batcher.flush()
 
 
 class BaseTool(ABC):
@@ -79,6 +451,15 @@ class BaseTool(ABC):
     - Storage backend integration
     """
     
+    # Schema-derived data shared by all instances of a tool class; schema
+    # properties build a new ToolSchema per access, so read it only once
+    _schema_info: Optional[_SchemaInfo] = None
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each subclass defines its own schema; never reuse a parent's
+        cls._schema_info = None
+    
     def __init__(self, settings: Optional[Settings] = None, storage=None):
         """
         Initialize base tool
@@ -90,11 +471,13 @@ class BaseTool(ABC):
         self.settings = settings
         self.storage = storage
         self._security_scanner = None
-        self._execution_metrics = {}
+        self._execution_metrics: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._successful_executions = 0
+        self._total_execution_time = 0.0
         
         # Initialize security scanner if settings available
         if settings and hasattr(settings, 'security_profile'):
-            sensitivity = settings.security_profile.value.upper() if hasattr(settings.security_profile, 'value') else 'HIGH'
+            sensitivity = _SCANNER_SENSITIVITY.get(settings.security_profile, "HIGH")
             self._security_scanner = SecurityScanner(sensitivity_level=sensitivity)
         
         logger.debug(f"Initialized {self.__class__.__name__}")
@@ -129,8 +512,10 @@ class BaseTool(ABC):
         Returns:
             Tool execution result
         """
-        execution_id = f"{self.schema.name}_{int(time.time() * 1000)}"
-        start_time = datetime.now()
+        schema_info = self._get_schema_info()
+        tool_name = schema_info.name
+        execution_id = f"{tool_name}_{next(_EXECUTION_IDS)}"
+        start_time = time.perf_counter()
         
         try:
             # Create execution context
@@ -143,24 +528,34 @@ class BaseTool(ABC):
             )
             
             # Validate parameters
-            validation_errors = await self._validate_parameters(parameters)
+            validation_errors = self._validate_parameters(parameters)
             if validation_errors:
+                messages = []
+                error_details = []
+                for error in validation_errors:
+                    messages.append(error.message)
+                    error_details.append({"field": error.field, "message": error.message, "code": error.code})
                 return ToolResult(
                     success=False,
-                    error_message=f"Parameter validation failed: {'; '.join(error.message for error in validation_errors)}",
+                    error_message=f"Parameter validation failed: {'; '.join(messages)}",
                     metadata={
-                        "validation_errors": [
-                            {"field": error.field, "message": error.message, "code": error.code}
-                            for error in validation_errors
-                        ],
+                        "validation_errors": error_details,
                         "execution_id": execution_id
                     }
                 )
             
             # Security scan for sensitive data
-            security_issues = await self._scan_for_security_threats(parameters)
+            scan_size = _scannable_size(parameters) if self._security_scanner is not None else 0
+            if not scan_size:
+                security_issues = None
+            elif scan_size >= _THREADED_SCAN_THRESHOLD:
+                # Large inputs can take the regex scan into milliseconds;
+                # run it off the event loop so other requests keep moving
+                security_issues = await asyncio.to_thread(self._scan_for_security_threats, parameters)
+            else:
+                security_issues = self._scan_for_security_threats(parameters)
             if security_issues:
-                logger.warning(f"Security threats detected in {self.schema.name}: {len(security_issues)} issues")
+                logger.warning(f"Security threats detected in {tool_name}: {len(security_issues)} issues")
                 return ToolResult(
                     success=False,
                     error_message="Security scan detected sensitive information in input parameters",
@@ -183,9 +578,9 @@ class BaseTool(ABC):
             
             # Record successful execution metrics
             execution_time = context.get_execution_time()
-            self._record_execution_metrics(execution_id, execution_time, True)
+            self._record_execution_metrics(execution_id, execution_time, True, tool_name)
             
-            logger.info(f"Tool {self.schema.name} executed successfully in {execution_time:.3f}s")
+            logger.info(f"Tool {tool_name} executed successfully in {execution_time:.3f}s")
             
             return ToolResult(
                 success=True,
@@ -193,15 +588,15 @@ class BaseTool(ABC):
                 execution_time=execution_time,
                 metadata={
                     "execution_id": execution_id,
-                    "tool_category": self.schema.category if hasattr(self.schema, 'category') else None
+                    "tool_category": schema_info.category
                 }
             )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self._record_execution_metrics(execution_id, execution_time, False)
+            execution_time = time.perf_counter() - start_time
+            self._record_execution_metrics(execution_id, execution_time, False, tool_name)
             
-            logger.error(f"Tool {self.schema.name} execution failed: {str(e)}")
+            logger.error(f"Tool {tool_name} execution failed: {str(e)}")
             
             return ToolResult(
                 success=False,
@@ -210,7 +605,20 @@ class BaseTool(ABC):
                 metadata={"execution_id": execution_id}
             )
     
-    async def _validate_parameters(self, parameters: Dict[str, Any]) -> List[ValidationError]:
+    def _get_schema_info(self) -> _SchemaInfo:
+        """Get this tool class's schema info, building it on first use"""
+        tool_class = type(self)
+        info = tool_class._schema_info
+        if info is None:
+            schema = self.schema
+            info = tool_class._schema_info = _SchemaInfo(
+                name=schema.name,
+                category=getattr(schema, "category", None),
+                validator=compile_parameter_validator(schema.parameters)
+            )
+        return info
+    
+    def _validate_parameters(self, parameters: Dict[str, Any]) -> List[ValidationError]:
         """
         Validate tool parameters against schema
         
@@ -220,111 +628,9 @@ class BaseTool(ABC):
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
-        schema_params = self.schema.parameters
-        
-        if not isinstance(schema_params, dict) or "properties" not in schema_params:
-            return errors
-        
-        required_fields = schema_params.get("required", [])
-        properties = schema_params.get("properties", {})
-        
-        # Check required fields
-        for field in required_fields:
-            if field not in parameters or parameters[field] is None:
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Required field '{field}' is missing",
-                    code="MISSING_REQUIRED_FIELD"
-                ))
-        
-        # Validate field types and constraints
-        for field, value in parameters.items():
-            if field not in properties:
-                continue
-                
-            field_spec = properties[field]
-            field_type = field_spec.get("type")
-            
-            if value is None:
-                continue
-            
-            # Type validation
-            if field_type == "string" and not isinstance(value, str):
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Field '{field}' must be a string",
-                    code="INVALID_TYPE"
-                ))
-            elif field_type == "integer" and not isinstance(value, int):
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Field '{field}' must be an integer",
-                    code="INVALID_TYPE"
-                ))
-            elif field_type == "number" and not isinstance(value, (int, float)):
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Field '{field}' must be a number",
-                    code="INVALID_TYPE"
-                ))
-            elif field_type == "boolean" and not isinstance(value, bool):
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Field '{field}' must be a boolean",
-                    code="INVALID_TYPE"
-                ))
-            
-            # Enum validation
-            enum_values = field_spec.get("enum")
-            if enum_values and value not in enum_values:
-                errors.append(ValidationError(
-                    field=field,
-                    message=f"Field '{field}' must be one of: {', '.join(map(str, enum_values))}",
-                    code="INVALID_ENUM_VALUE"
-                ))
-            
-            # String length validation
-            if field_type == "string" and isinstance(value, str):
-                min_length = field_spec.get("minLength")
-                max_length = field_spec.get("maxLength")
-                
-                if min_length and len(value) < min_length:
-                    errors.append(ValidationError(
-                        field=field,
-                        message=f"Field '{field}' must be at least {min_length} characters",
-                        code="STRING_TOO_SHORT"
-                    ))
-                
-                if max_length and len(value) > max_length:
-                    errors.append(ValidationError(
-                        field=field,
-                        message=f"Field '{field}' must be at most {max_length} characters",
-                        code="STRING_TOO_LONG"
-                    ))
-            
-            # Number range validation
-            if field_type in ["number", "integer"] and isinstance(value, (int, float)):
-                minimum = field_spec.get("minimum")
-                maximum = field_spec.get("maximum")
-                
-                if minimum is not None and value < minimum:
-                    errors.append(ValidationError(
-                        field=field,
-                        message=f"Field '{field}' must be at least {minimum}",
-                        code="NUMBER_TOO_SMALL"
-                    ))
-                
-                if maximum is not None and value > maximum:
-                    errors.append(ValidationError(
-                        field=field,
-                        message=f"Field '{field}' must be at most {maximum}",
-                        code="NUMBER_TOO_LARGE"
-                    ))
-        
-        return errors
+        return self._get_schema_info().validator(parameters)
     
-    async def _scan_for_security_threats(self, parameters: Dict[str, Any]) -> List[SecurityThreat]:
+    def _scan_for_security_threats(self, parameters: Dict[str, Any]) -> List[SecurityThreat]:
         """
         Scan parameters for security threats
         
@@ -337,40 +643,48 @@ class BaseTool(ABC):
         if not self._security_scanner:
             return []
         
-        threats = []
-        
-        # Scan string parameters for threats
-        for key, value in parameters.items():
-            if isinstance(value, str) and value.strip():
-                # Skip API credentials parameters - they're expected to contain sensitive data
-                if key.lower() in ['api_key', 'api_secret', 'private_key', 'secret', 'token']:
-                    continue
-                
-                detected_threats = self._security_scanner.scan_content(value, context=f"parameter:{key}")
-                
-                # Filter out low-confidence threats for parameter validation
-                high_confidence_threats = [
-                    threat for threat in detected_threats
-                    if threat.confidence > 0.7 and threat.level in [ThreatLevel.CRITICAL, ThreatLevel.HIGH]
-                ]
-                
-                threats.extend(high_confidence_threats)
-        
-        return threats
-    
-    def _record_execution_metrics(self, execution_id: str, execution_time: float, success: bool) -> None:
+        # Credential parameters are expected to contain sensitive data, and
+        # low-confidence threats are not enough to reject a call
+        return [
+            threat
+            for threat in self._security_scanner.scan_parameters(parameters, skip_keys=_CREDENTIAL_KEYS)
+            if threat.confidence > 0.7 and threat.level in _BLOCKING_THREAT_LEVELS
+        ]
+    
+    def _record_execution_metrics(
+        self,
+        execution_id: str,
+        execution_time: float,
+        success: bool,
+        tool_name: Optional[str] = None
+    ) -> None:
         """Record execution metrics for monitoring"""
-        self._execution_metrics[execution_id] = {
-            "tool_name": self.schema.name,
+        metrics = self._execution_metrics
+
+        # Execution ids are unique per process, but replace rather than
+        # double-count if a caller reuses one
+        previous = metrics.pop(execution_id, None)
+        if previous is not None:
+            self._unrecord_execution_metric(previous)
+
+        metrics[execution_id] = {
+            "tool_name": tool_name or self._get_schema_info().name,
             "execution_time": execution_time,
             "success": success,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()  # formatted only when metrics are read
         }
+        self._successful_executions += success
+        self._total_execution_time += execution_time
         
         # Keep only last 100 executions to prevent memory growth
-        if len(self._execution_metrics) > 100:
-            oldest_key = min(self._execution_metrics.keys())
-            del self._execution_metrics[oldest_key]
+        if len(metrics) > _MAX_EXECUTION_METRICS:
+            _, oldest = metrics.popitem(last=False)
+            self._unrecord_execution_metric(oldest)
+
+    def _unrecord_execution_metric(self, metric: Dict[str, Any]) -> None:
+        """Remove an evicted entry from the running totals"""
+        self._successful_executions -= metric["success"]
+        self._total_execution_time -= metric["execution_time"]
     
     def get_execution_metrics(self) -> Dict[str, Any]:
         """Get execution metrics for this tool"""
@@ -378,15 +692,17 @@ class BaseTool(ABC):
             return {"total_executions": 0}
         
         total = len(self._execution_metrics)
-        successful = sum(1 for m in self._execution_metrics.values() if m["success"])
-        avg_time = sum(m["execution_time"] for m in self._execution_metrics.values()) / total
+        successful = self._successful_executions
+        avg_time = self._total_execution_time / total
         
         return {
             "total_executions": total,
             "successful_executions": successful,
             "success_rate": successful / total,
             "average_execution_time": round(avg_time, 3),
-            "last_execution": max(m["timestamp"] for m in self._execution_metrics.values())
+            "last_execution": datetime.fromtimestamp(
+                next(reversed(self._execution_metrics.values()))["timestamp"]
+            ).isoformat()
         }
     
     # === Helper Methods for Common Patterns ===
@@ -470,70 +786,9 @@ class BaseTool(ABC):
         Returns:
             Dictionary of educational content
         """
-        context = context or {}
-        
-        # Base educational content library
-        content_library = {
-            "crypto_basics": {
-                "title": "Understanding Cryptocurrency",
-                "content": """
-Cryptocurrency is digital money secured by cryptography. Unlike traditional currency, 
-it's decentralized - meaning no single authority (like a bank) controls it.
-
-Key concepts:
-• **Blockchain**: The technology that records all transactions
-• **Volatility**: Crypto prices can change dramatically
-• **Market Cap**: The total value of a cryptocurrency
-• **Liquidity**: How easily you can buy/sell without affecting price
-                """.strip()
-            },
-            
-            "portfolio_management": {
-                "title": "Smart Portfolio Management", 
-                "content": """
-A crypto portfolio is your collection of different cryptocurrencies. Smart management principles:
-
-• **Diversification**: Don't put all money in one crypto
-• **Position Sizing**: Only invest what you can afford to lose
-• **Risk Management**: Set limits on losses
-• **Regular Review**: Check performance and rebalance if needed
-• **Long-term Thinking**: Avoid emotional day-trading
-                """.strip()
-            },
-            
-            "technical_analysis": {
-                "title": "Technical Analysis Basics",
-                "content": """
-Technical analysis uses price charts and patterns to predict future movements. 
-
-Important principles:
-• **No Crystal Ball**: Indicators show possibilities, not certainties
-• **Multiple Confirmation**: Use several indicators together
-• **Market Context**: Consider overall market conditions
-• **Risk Management**: Always have exit strategies
-• **Practice**: Start with small amounts while learning
-                """.strip()
-            },
-            
-            "risk_management": {
-                "title": "Managing Investment Risk",
-                "content": """
-Risk management is protecting your investment capital. Key strategies:
-
-• **Stop Losses**: Set prices where you'll sell to limit losses
-• **Position Sizing**: Never risk more than 1-5% on a single trade
-• **Diversification**: Spread risk across different assets
-• **Emotional Control**: Don't panic buy/sell
-• **Emergency Fund**: Keep some cash available for opportunities
-                """.strip()
-            }
-        }
-        
-        # Return requested content or default guidance
-        return content_library.get(content_type, {
-            "title": "Investment Guidance",
-            "content": "Remember: Do your own research, never invest more than you can afford to lose, and consider your risk tolerance."
-        })
+        # Return requested content or default guidance; copied so callers
+        # can personalise it without touching the shared library
+        return dict(_CONTENT_LIBRARY.get(content_type, _DEFAULT_CONTENT))
     
     async def _store_execution_history(
         self,
@@ -554,7 +809,7 @@ Risk management is protecting your investment capital. Key strategies:
         
         try:
             history_data = {
-                "tool_name": self.schema.name,
+                "tool_name": self._get_schema_info().name,
                 "parameters": context.parameters,
                 "execution_time": context.get_execution_time(),
                 "success": True,
@@ -563,41 +818,27 @@ Risk management is protecting your investment capital. Key strategies:
             }
             
             # Store using generic record storage
-            from persistent_mcp.storage.interface import StorageRecord, DataType
+            from fortunamind_persistent_mcp.persistent_mcp.storage.interface import StorageRecord, DataType
             
             record = StorageRecord(
                 user_id_hash=context.auth_context.user_id_hash,
                 data_type=DataType.USER_PREFERENCE,  # Using as generic activity tracking
                 data=history_data,
-                timestamp=context.start_time,
-                tags=["tool_execution", self.schema.name],
+                timestamp=datetime.fromtimestamp(time.time() - context.get_execution_time()),
+                tags=["tool_execution", self._get_schema_info().name],
                 metadata={"category": "execution_history"}
             )
             
-            await self.storage.store_record(record)
+            # Written in batches in the background rather than one
+            # round-trip per tool call
+            _history_batcher(self.storage).submit(record)
             
         except Exception as e:
             logger.warning(f"Failed to store execution history: {e}")
     
     def _summarize_result(self, result: Any) -> Dict[str, Any]:
         """Create a summary of execution result for history storage"""
-        if isinstance(result, dict):
-            return {
-                "type": "dict",
-                "keys": list(result.keys())[:10],  # Limit to prevent large storage
-                "size": len(result)
-            }
-        elif isinstance(result, list):
-            return {
-                "type": "list",
-                "length": len(result),
-                "sample": result[:3] if result else []
-            }
-        else:
-            return {
-                "type": type(result).__name__,
-                "summary": str(result)[:200]  # Truncate long strings
-            }
+        return summarize_result(result)
 
 
 class ReadOnlyTool(BaseTool, FrameworkReadOnlyTool):
@@ -5,8 +5,10 @@ Provides centralized dependency management for the FortunaMind Persistent MCP Se
 Enables loose coupling, easier testing, and better extensibility.
 """
 
+import importlib
 import logging
-from typing import Dict, Any, Optional, Type, TypeVar, Callable
+import time
+from typing import Dict, Any, Optional, Tuple, Type, TypeVar, Callable
 from abc import ABC, abstractmethod
 
 from fortunamind_persistent_mcp.config import Settings
@@ -16,57 +18,81 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
+def _type_name(service_type: Type) -> str:
+    """Qualified name of a service type, for log messages"""
+    return f"{service_type.__module__}.{service_type.__qualname__}"
+
+
+# Registration kinds stored alongside each ServiceRegistry entry
+_SINGLETON, _INSTANCE, _FACTORY = range(3)
+
+
 class ServiceRegistry:
     """Simple service registry for dependency injection"""
     
     def __init__(self):
-        self._services: Dict[str, Any] = {}
-        self._factories: Dict[str, Callable] = {}
-        self._singletons: Dict[str, Any] = {}
+        # One (kind, payload) entry per service type, so get() is a single
+        # probe. Type hashing is identity-based, so lookups build no strings
+        self._entries: Dict[type, Tuple[int, Any]] = {}
         
     def register_singleton(self, service_type: Type[T], instance: T) -> None:
         """Register a singleton instance"""
-        key = self._get_key(service_type)
-        self._singletons[key] = instance
-        logger.debug(f"Registered singleton: {key}")
+        self._entries[service_type] = (_SINGLETON, instance)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Registered singleton: %s", _type_name(service_type))
         
     def register_factory(self, service_type: Type[T], factory: Callable[..., T]) -> None:
         """Register a factory function"""
-        key = self._get_key(service_type)
-        self._factories[key] = factory
-        logger.debug(f"Registered factory: {key}")
+        self._entries[service_type] = (_FACTORY, factory)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Registered factory: %s", _type_name(service_type))
         
     def register_instance(self, service_type: Type[T], instance: T) -> None:
         """Register a specific instance"""
-        key = self._get_key(service_type)
-        self._services[key] = instance
-        logger.debug(f"Registered instance: {key}")
+        self._entries[service_type] = (_INSTANCE, instance)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Registered instance: %s", _type_name(service_type))
         
     def get(self, service_type: Type[T]) -> Optional[T]:
         """Get a service instance"""
-        key = self._get_key(service_type)
-        
-        # Check singletons first
-        if key in self._singletons:
-            return self._singletons[key]
+        entry = self._entries.get(service_type)
+        if entry is None:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("Service not found: %s", _type_name(service_type))
+            return None
             
-        # Check registered instances
-        if key in self._services:
-            return self._services[key]
+        kind, payload = entry
+        if kind != _FACTORY:
+            return payload
             
-        # Try factory
-        if key in self._factories:
-            instance = self._factories[key]()
-            # Cache as singleton if it was registered as one
-            self._singletons[key] = instance
-            return instance
-            
-        logger.warning(f"Service not found: {key}")
-        return None
-        
-    def _get_key(self, service_type: Type) -> str:
-        """Get a consistent key for a service type"""
-        return f"{service_type.__module__}.{service_type.__qualname__}"
+        # Factory results are cached as singletons
+        instance = payload()
+        self._entries[service_type] = (_SINGLETON, instance)
+        return instance
+
+
+# Implementations by configuration name as (module, class); imported on
+# first use so only the selected implementation is loaded
+_STORAGE_BACKENDS = {
+    "mock": ("..persistent_mcp.storage.mock_backend", "MockStorageBackend"),
+    "supabase": ("..persistent_mcp.storage.supabase_backend", "SupabaseStorageBackend"),
+}
+
+_ADAPTERS = {
+    "http": ("..persistent_mcp.adapters.mcp_http", "MCPHttpAdapter"),
+    "stdio": ("..persistent_mcp.adapters.mcp_stdio", "MCPStdioAdapter"),
+}
+
+_class_cache: Dict[Tuple[str, str], type] = {}
+
+
+def _load_class(module_name: str, class_name: str) -> type:
+    """Import a class on first use and remember it"""
+    cls = _class_cache.get((module_name, class_name))
+    if cls is None:
+        module = importlib.import_module(module_name, __package__)
+        cls = _class_cache[(module_name, class_name)] = getattr(module, class_name)
+    return cls
 
 
 class StorageFactory:
@@ -76,13 +102,10 @@ class StorageFactory:
     def create(storage_type: str, settings: Settings):
         """Create storage backend based on configuration"""
         if storage_type == "mock" or not settings.database_url or "mock" in settings.database_url:
-            from ..persistent_mcp.storage import MockStorageBackend
-            return MockStorageBackend(settings)
-        elif storage_type == "supabase":
-            from ..persistent_mcp.storage import SupabaseStorageBackend
-            return SupabaseStorageBackend(settings)
-        else:
+            storage_type = "mock"
+        elif storage_type not in _STORAGE_BACKENDS:
             raise ValueError(f"Unknown storage type: {storage_type}")
+        return _load_class(*_STORAGE_BACKENDS[storage_type])(settings)
 
 
 class AdapterFactory:
@@ -91,14 +114,9 @@ class AdapterFactory:
     @staticmethod
     def create(adapter_type: str, registry, storage, auth, settings):
         """Create MCP adapter based on configuration"""
-        if adapter_type == "http":
-            from ..persistent_mcp.adapters import MCPHttpAdapter
-            return MCPHttpAdapter(registry, storage, auth, settings)
-        elif adapter_type == "stdio":
-            from ..persistent_mcp.adapters import MCPStdioAdapter
-            return MCPStdioAdapter(registry, storage, auth, settings)
-        else:
+        if adapter_type not in _ADAPTERS:
             raise ValueError(f"Unknown adapter type: {adapter_type}")
+        return _load_class(*_ADAPTERS[adapter_type])(registry, storage, auth, settings)
 
 
 class DIContainer:
@@ -108,27 +126,29 @@ class DIContainer:
         self.settings = settings
         self.registry = ServiceRegistry()
         self._initialized = False
-        
-    async def initialize(self) -> None:
+        # Resolved in initialize() / on first use; get_adapter reads these directly
+        self._auth = None
+        self._tool_registry = None
+        self._storage = None
+        # Storage backend key in _STORAGE_BACKENDS, decided once from the settings
+        database_url = settings.database_url
+        self._storage_type = "mock" if not database_url or "mock" in database_url else "supabase"
+        
+    def initialize(self) -> None:
         """Initialize the container and register services"""
         if self._initialized:
             return
             
         logger.info("Initializing dependency injection container")
+        start_time = time.perf_counter()
         
         # Register core services
         self.registry.register_instance(Settings, self.settings)
         
-        # Register storage factory
-        self.registry.register_factory(
-            type(None),  # We'll use string-based lookup for factories
-            lambda: StorageFactory.create("auto", self.settings)
-        )
-        
         # Register authentication
         from ..persistent_mcp.auth import SubscriberAuth
-        auth_instance = SubscriberAuth(self.settings)
-        self.registry.register_singleton(SubscriberAuth, auth_instance)
+        self._auth = SubscriberAuth(self.settings)
+        self.registry.register_singleton(SubscriberAuth, self._auth)
         
         # Register tool registry
         try:
@@ -141,25 +161,28 @@ class DIContainer:
             from ..core.mock import ToolRegistry
             logger.warning("Using mock ToolRegistry - framework not available")
         
-        tool_registry = ToolRegistry()
-        self.registry.register_singleton(ToolRegistry, tool_registry)
+        self._tool_registry = ToolRegistry()
+        self.registry.register_singleton(ToolRegistry, self._tool_registry)
         
         self._initialized = True
-        logger.info("✅ Dependency injection container initialized")
+        logger.info(
+            f"✅ Dependency injection container initialized in "
+            f"{(time.perf_counter() - start_time) * 1000:.1f}ms"
+        )
         
     def get_storage(self):
-        """Get storage backend instance"""
-        # For now, create directly - will improve this
-        storage_type = "mock" if "mock" in self.settings.database_url else "supabase"
-        return StorageFactory.create(storage_type, self.settings)
+        """Get storage backend instance, created once per container"""
+        if self._storage is None:
+            from ..persistent_mcp.storage.interface import StorageBackend
+            self._storage = StorageFactory.create(self._storage_type, self.settings)
+            self.registry.register_singleton(StorageBackend, self._storage)
+        return self._storage
         
     def get_adapter(self, adapter_type: str):
         """Get MCP adapter instance"""
-        registry = self.registry.get(ToolRegistry)
-        storage = self.get_storage()
-        auth = self.registry.get(SubscriberAuth)
-        
-        return AdapterFactory.create(adapter_type, registry, storage, auth, self.settings)
+        return AdapterFactory.create(
+            adapter_type, self._tool_registry, self.get_storage(), self._auth, self.settings
+        )
         
     def get_service(self, service_type: Type[T]) -> Optional[T]:
         """Get a service from the container"""
@@ -169,9 +192,9 @@ class DIContainer:
         """Cleanup container resources"""
         logger.info("Shutting down dependency injection container")
         
-        # Cleanup storage if needed
+        # Cleanup storage if one was created
+        storage, self._storage = self._storage, None
         try:
-            storage = self.get_storage()
             if hasattr(storage, 'cleanup'):
                 await storage.cleanup()
         except Exception as e:
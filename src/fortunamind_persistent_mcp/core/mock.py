@@ -7,30 +7,43 @@ the real framework tools when possible.
 """
 
 import logging
+import os
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 
 logger = logging.getLogger(__name__)
 
-# Framework proxy - try to import real framework tools first
-FRAMEWORK_AVAILABLE = False
+# Framework proxy - real framework tools are preferred, imported on first use
+_framework_available = False
+_framework_checked = False
 _framework_tools = {}
 
+# Copied framework checkout, resolved once at import
+_FRAMEWORK_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../framework/src"))
+
+# Names served by the framework when it is available, by the mocks below otherwise
+_FRAMEWORK_NAMES = frozenset({
+    'AuthContext', 'ToolResult', 'ToolSchema', 'ReadOnlyTool', 'WriteEnabledTool', 'ToolRegistry',
+    'UnifiedPortfolioTool', 'UnifiedPricesTool', 'UnifiedMarketResearchTool',
+    'UnifiedPerformanceTool', 'UnifiedTransactionTool', 'UnifiedOrdersTool',
+})
+
 def _try_import_framework():
     """Attempt to import framework tools from the copied framework directory"""
-    global FRAMEWORK_AVAILABLE, _framework_tools
+    global _framework_available, _framework_tools
+    
+    if _framework_available:
+        return True
     
     try:
         # Import from the copied framework at framework/src/
-        import sys
-        import os
-        
-        # Add framework to path
-        framework_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../framework/src"))
-        if framework_path not in sys.path:
-            sys.path.insert(0, framework_path)
+        if _FRAMEWORK_PATH not in sys.path:
+            sys.path.insert(0, _FRAMEWORK_PATH)
         
         # Try importing core framework first
         import core.interfaces as framework_interfaces
@@ -70,7 +83,7 @@ def _try_import_framework():
             'ToolRegistry': ToolRegistry,
         })
         
-        FRAMEWORK_AVAILABLE = True
+        _framework_available = True
         logger.info("✅ Framework tools loaded from copied framework directory")
         return True
         
@@ -82,16 +95,25 @@ def _try_import_framework():
         logger.error(f"❌ Unexpected error loading framework: {e}")
         return False
 
-# Try to import framework tools on module load
-_try_import_framework()
+def _ensure_framework() -> bool:
+    """Try the framework import once, the first time a proxied name is used"""
+    global _framework_checked
+    if not _framework_checked:
+        _framework_checked = True
+        # Timed for cold-start tracing; run with -X importtime for a per-module breakdown
+        start_time = time.perf_counter()
+        _try_import_framework()
+        logger.debug(f"Framework import attempt took {(time.perf_counter() - start_time) * 1000:.1f}ms")
+    return _framework_available
 
 def get_framework_tool(name: str):
     """Get a framework tool if available, otherwise return None"""
+    _ensure_framework()
     return _framework_tools.get(name)
 
 
-@dataclass
-class AuthContext:
+@dataclass(slots=True)
+class MockAuthContext:
     """Mock authentication context"""
     api_key: str
     api_secret: str
@@ -101,8 +123,8 @@ class AuthContext:
     source: str = "mock"
 
 
-@dataclass
-class ToolResult:
+@dataclass(slots=True)
+class MockToolResult:
     """Mock tool execution result"""
     success: bool
     data: Any = None
@@ -111,8 +133,8 @@ class ToolResult:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
-class ToolSchema:
+@dataclass(slots=True)
+class MockToolSchema:
     """Mock tool schema"""
     name: str
     description: str
@@ -122,7 +144,7 @@ class ToolSchema:
     returns: Dict[str, Any]
 
 
-class ToolRegistry:
+class MockToolRegistry:
     """Mock tool registry"""
     
     def __init__(self):
@@ -131,9 +153,13 @@ class ToolRegistry:
     
     def register(self, tool):
         """Register a tool"""
-        if hasattr(tool, 'schema') and hasattr(tool.schema, 'name'):
-            self.tools[tool.schema.name] = tool
-            logger.debug(f"Registered mock tool: {tool.schema.name}")
+        try:
+            # Interned once here; names are a small fixed set looked up per call
+            name = sys.intern(tool.schema.name)
+        except AttributeError:
+            return
+        self.tools[name] = tool
+        logger.debug(f"Registered mock tool: {name}")
     
     def get_tools(self) -> List[Any]:
         """Get all registered tools"""
@@ -144,171 +170,194 @@ class ToolRegistry:
         return self.tools.get(name)
 
 
-class ReadOnlyTool(ABC):
+class MockReadOnlyTool(ABC):
     """Mock read-only tool base class"""
     
     @property
     @abstractmethod
-    def schema(self) -> ToolSchema:
+    def schema(self) -> MockToolSchema:
         """Tool schema"""
         pass
     
     @abstractmethod
-    async def _execute_impl(self, auth_context: Optional[AuthContext], **parameters) -> Any:
+    async def _execute_impl(self, auth_context: Optional[MockAuthContext], **parameters) -> Any:
         """Execute tool implementation"""
         pass
     
-    async def execute(self, auth_context: Optional[AuthContext], **parameters) -> ToolResult:
+    async def execute(self, auth_context: Optional[MockAuthContext], **parameters) -> MockToolResult:
         """Execute tool with error handling"""
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             result = await self._execute_impl(auth_context, **parameters)
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
-            return ToolResult(
+            return MockToolResult(
                 success=True,
                 data=result,
                 execution_time=execution_time
             )
         except Exception as e:
             logger.error(f"Tool execution failed: {e}")
-            return ToolResult(
+            return MockToolResult(
                 success=False,
                 error_message=str(e)
             )
 
 
-class WriteEnabledTool(ReadOnlyTool):
+class MockWriteEnabledTool(MockReadOnlyTool):
     """Mock write-enabled tool base class"""
     pass
 
 
-# Export the right classes - framework if available, mock if not
+# Mock implementations used when the framework is not available
 
-# Core classes
-if FRAMEWORK_AVAILABLE:
-    # Use real framework classes
-    AuthContext = _framework_tools['AuthContext']
-    ToolResult = _framework_tools['ToolResult'] 
-    ToolSchema = _framework_tools['ToolSchema']
-    ReadOnlyTool = _framework_tools['ReadOnlyTool']
-    WriteEnabledTool = _framework_tools['WriteEnabledTool']
-    ToolRegistry = _framework_tools['ToolRegistry']
-    
-    # Tool classes
-    UnifiedPortfolioTool = _framework_tools['UnifiedPortfolioTool']
-    UnifiedPricesTool = _framework_tools['UnifiedPricesTool']
-    UnifiedMarketResearchTool = _framework_tools['UnifiedMarketResearchTool']
-    UnifiedPerformanceTool = _framework_tools['UnifiedPerformanceTool']
-    UnifiedTransactionTool = _framework_tools['UnifiedTransactionTool']
-    UnifiedOrdersTool = _framework_tools['UnifiedOrdersTool']
+class MockUnifiedPricesTool:
+    """Mock prices tool for development"""
     
-else:
-    # Use mock implementations when framework not available
+    @cached_property
+    def schema(self) -> MockToolSchema:
+        return MockToolSchema(
+            name="unified_prices",
+            description="Mock prices tool",
+            category="market_data",
+            permissions=["read_only"],
+            parameters={},
+            returns={}
+        )
     
-    class MockUnifiedPricesTool:
-        """Mock prices tool for development"""
+    async def _execute_impl(self, auth_context: Optional[MockAuthContext], **parameters) -> Any:
+        """Mock price data implementation"""
+        logger.warning("Using mock price data - framework not available")
         
-        @property
-        def schema(self) -> ToolSchema:
-            return ToolSchema(
-                name="unified_prices",
-                description="Mock prices tool",
-                category="market_data",
-                permissions=["read_only"],
-                parameters={},
-                returns={}
-            )
+        symbol = parameters.get("symbol", "BTC-USD")
+        granularity = parameters.get("granularity", "ONE_HOUR")
+        start = parameters.get("start", 7)
         
-        async def _execute_impl(self, auth_context: Optional[AuthContext], **parameters) -> Any:
-            """Mock price data implementation"""
-            logger.warning("Using mock price data - framework not available")
-            
-            symbol = parameters.get("symbol", "BTC-USD")
-            granularity = parameters.get("granularity", "ONE_HOUR")
-            start = parameters.get("start", 7)
-            
-            # Generate mock candlestick data
-            import random
-            from datetime import timedelta
-            
-            base_price = 45000 if "BTC" in symbol else 3000
-            candles = []
-            
-            for i in range(24 * start):  # Hourly data for specified days
-                price = base_price * (1 + random.uniform(-0.05, 0.05))
-                high = price * random.uniform(1.01, 1.03)
-                low = price * random.uniform(0.97, 0.99)
-                volume = random.uniform(1000, 10000)
-                
-                candles.append({
-                    "start": (datetime.now() - timedelta(hours=24*start-i)).isoformat(),
-                    "low": str(low),
-                    "high": str(high),
-                    "open": str(price),
-                    "close": str(price),
-                    "volume": str(volume)
-                })
-            
-            return {
-                "symbol": symbol,
-                "granularity": granularity,
-                "candles": candles
+        # Generate mock candlestick data, drawing every series at once
+        import numpy as np
+        
+        base_price = 45000 if "BTC" in symbol else 3000
+        count = 24 * start  # Hourly data for specified days
+        rng = np.random.default_rng()
+        prices = base_price * (1 + rng.uniform(-0.05, 0.05, count))
+        highs = prices * rng.uniform(1.01, 1.03, count)
+        lows = prices * rng.uniform(0.97, 0.99, count)
+        volumes = rng.uniform(1000, 10000, count)
+        
+        # One clock read; hourly start times formatted as a single array
+        first_start = np.datetime64(datetime.now(), "us") - np.timedelta64(count, "h")
+        starts = (first_start + np.arange(count).astype("timedelta64[h]")).astype(str).tolist()
+        
+        candles = [
+            {
+                "start": start_time,
+                "low": low,
+                "high": high,
+                "open": price,
+                "close": price,
+                "volume": volume
             }
+            for start_time, price, high, low, volume in zip(
+                starts, prices.tolist(), highs.tolist(), lows.tolist(), volumes.tolist()
+            )
+        ]
         
-        async def execute(self, auth_context: Optional[AuthContext], **parameters) -> ToolResult:
-            """Execute with mock data"""
-            try:
-                result = await self._execute_impl(auth_context, **parameters)
-                return ToolResult(success=True, data=result)
-            except Exception as e:
-                return ToolResult(success=False, error_message=str(e))
+        return {
+            "symbol": symbol,
+            "granularity": granularity,
+            "candles": candles
+        }
     
-    # Mock tool classes
-    UnifiedPricesTool = MockUnifiedPricesTool
+    async def execute(self, auth_context: Optional[MockAuthContext], **parameters) -> MockToolResult:
+        """Execute with mock data"""
+        try:
+            result = await self._execute_impl(auth_context, **parameters)
+            return MockToolResult(success=True, data=result)
+        except Exception as e:
+            return MockToolResult(success=False, error_message=str(e))
+
+class MockBaseTool(MockReadOnlyTool):
+    """Generic mock tool"""
+    # Subclasses set their tool name on the class; instances share it
+    name: str = "mock"
     
-    class MockBaseTool(ReadOnlyTool):
-        """Generic mock tool"""
-        def __init__(self, name: str):
+    def __init__(self, name: Optional[str] = None):
+        if name is not None:
             self.name = name
-            
-        @property  
-        def schema(self) -> ToolSchema:
-            return ToolSchema(
-                name=self.name,
-                description=f"Mock {self.name} tool",
-                category="mock",
-                permissions=["read_only"],
-                parameters={},
-                returns={}
-            )
         
-        async def _execute_impl(self, auth_context: Optional[AuthContext], **parameters) -> Any:
-            return {"status": "mock", "message": f"Mock {self.name} response"}
-    
-    # Create mock versions of other tools
-    class MockUnifiedPortfolioTool(MockBaseTool):
-        def __init__(self):
-            super().__init__("portfolio")
-    
-    class MockUnifiedMarketResearchTool(MockBaseTool):
-        def __init__(self):
-            super().__init__("market_research")
-    
-    class MockUnifiedPerformanceTool(MockBaseTool):
-        def __init__(self):
-            super().__init__("performance")
-            
-    class MockUnifiedTransactionTool(MockBaseTool):
-        def __init__(self):
-            super().__init__("transactions")
-            
-    class MockUnifiedOrdersTool(MockBaseTool):
-        def __init__(self):
-            super().__init__("orders")
+    @cached_property
+    def schema(self) -> MockToolSchema:
+        # Built once per tool; registration and dispatch read it repeatedly
+        return MockToolSchema(
+            name=self.name,
+            description=f"Mock {self.name} tool",
+            category="mock",
+            permissions=["read_only"],
+            parameters={},
+            returns={}
+        )
     
+    async def _execute_impl(self, auth_context: Optional[MockAuthContext], **parameters) -> Any:
+        return {"status": "mock", "message": f"Mock {self.name} response"}
+
+# Create mock versions of other tools
+class MockUnifiedPortfolioTool(MockBaseTool):
+    name = "portfolio"
+
+class MockUnifiedMarketResearchTool(MockBaseTool):
+    name = "market_research"
+
+class MockUnifiedPerformanceTool(MockBaseTool):
+    name = "performance"
+        
+class MockUnifiedTransactionTool(MockBaseTool):
+    name = "transactions"
+        
+class MockUnifiedOrdersTool(MockBaseTool):
+    name = "orders"
+
+_MOCKS = {
+    'AuthContext': MockAuthContext,
+    'ToolResult': MockToolResult,
+    'ToolSchema': MockToolSchema,
+    'ReadOnlyTool': MockReadOnlyTool,
+    'WriteEnabledTool': MockWriteEnabledTool,
+    'ToolRegistry': MockToolRegistry,
+    'UnifiedPortfolioTool': MockUnifiedPortfolioTool,
+    'UnifiedPricesTool': MockUnifiedPricesTool,
+    'UnifiedMarketResearchTool': MockUnifiedMarketResearchTool,
+    'UnifiedPerformanceTool': MockUnifiedPerformanceTool,
+    'UnifiedTransactionTool': MockUnifiedTransactionTool,
+    'UnifiedOrdersTool': MockUnifiedOrdersTool,
+}
+
+if TYPE_CHECKING:
+    # Static view of the lazily resolved exports; at runtime these names are
+    # absent so __getattr__ below decides between framework and mock
+    FRAMEWORK_AVAILABLE: bool
+    AuthContext = MockAuthContext
+    ToolResult = MockToolResult
+    ToolSchema = MockToolSchema
+    ReadOnlyTool = MockReadOnlyTool
+    WriteEnabledTool = MockWriteEnabledTool
+    ToolRegistry = MockToolRegistry
     UnifiedPortfolioTool = MockUnifiedPortfolioTool
+    UnifiedPricesTool = MockUnifiedPricesTool
     UnifiedMarketResearchTool = MockUnifiedMarketResearchTool
     UnifiedPerformanceTool = MockUnifiedPerformanceTool
     UnifiedTransactionTool = MockUnifiedTransactionTool
-    UnifiedOrdersTool = MockUnifiedOrdersTool
\ No newline at end of file
+    UnifiedOrdersTool = MockUnifiedOrdersTool
+
+
+def __getattr__(name: str) -> Any:
+    """Export the right classes - framework if available, mock if not (PEP 562)"""
+    value: Any
+    if name == 'FRAMEWORK_AVAILABLE':
+        value = _ensure_framework()
+    elif name in _FRAMEWORK_NAMES:
+        value = _framework_tools[name] if _ensure_framework() else _MOCKS[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Bind the resolved value so later lookups skip this hook
+    globals()[name] = value
+    return value
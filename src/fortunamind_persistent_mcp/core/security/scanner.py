@@ -7,7 +7,7 @@ prompt injection attempts, and other security threats.
 
 import re
 import logging
-from typing import List, Dict, Any, Optional, Pattern
+from typing import AbstractSet, FrozenSet, List, Dict, Any, Optional, Pattern
 from enum import Enum
 from dataclasses import dataclass
 
@@ -25,6 +25,17 @@ class ThreatLevel(str, Enum):
     INFO = "info"        # Informational only
 
 
+# Threat levels each sensitivity setting ignores
+_NO_LEVELS: FrozenSet[ThreatLevel] = frozenset()
+_SKIPPED_LEVELS: Dict[str, FrozenSet[ThreatLevel]] = {
+    "STRICT": frozenset({ThreatLevel.LOW, ThreatLevel.INFO}),
+    "HIGH": frozenset({ThreatLevel.INFO}),
+}
+
+# Threat levels that make content unsafe
+_UNSAFE_LEVELS: FrozenSet[ThreatLevel] = frozenset({ThreatLevel.CRITICAL, ThreatLevel.HIGH})
+
+
 @dataclass
 class SecurityThreat:
     """Detected security threat"""
@@ -104,13 +115,13 @@ class SecurityScanner:
         threats = []
         content_lower = content.lower()
         
+        skipped_levels = _SKIPPED_LEVELS.get(self.sensitivity_level, _NO_LEVELS)
+        
         # Scan with compiled patterns
         for category, pattern_list in self.compiled_patterns.items():
             for compiled_pattern, description, level, confidence, action in pattern_list:
                 # Skip low-priority patterns if sensitivity is high
-                if self.sensitivity_level == "STRICT" and level in [ThreatLevel.LOW, ThreatLevel.INFO]:
-                    continue
-                if self.sensitivity_level == "HIGH" and level == ThreatLevel.INFO:
+                if level in skipped_levels:
                     continue
                     
                 matches = compiled_pattern.findall(content)
@@ -139,6 +150,32 @@ class SecurityScanner:
         
         return threats
     
+    def scan_parameters(
+        self,
+        parameters: Dict[str, Any],
+        skip_keys: AbstractSet[str] = frozenset()
+    ) -> List[SecurityThreat]:
+        """
+        Scan the string values of a parameter dict for security threats
+        
+        Args:
+            parameters: Parameter name to value mapping
+            skip_keys: Lowercase parameter names to leave unscanned
+            
+        Returns:
+            List of detected security threats, grouped by parameter
+        """
+        threats = []
+        
+        for key, value in parameters.items():
+            if not isinstance(value, str) or not value.strip():
+                continue
+            if key in skip_keys or key.lower() in skip_keys:
+                continue
+            threats.extend(self.scan_content(value, context=f"parameter:{key}"))
+        
+        return threats
+    
     def _calculate_confidence(self, matches: List[str], content: str, category: str, base_confidence: float) -> float:
         """Calculate confidence score based on context"""
         confidence = base_confidence
@@ -174,7 +211,7 @@ class SecurityScanner:
         # Content is unsafe if there are CRITICAL or HIGH level threats
         critical_threats = [
             t for t in threats 
-            if t.level in [ThreatLevel.CRITICAL, ThreatLevel.HIGH] and t.confidence > 0.7
+            if t.level in _UNSAFE_LEVELS and t.confidence > 0.7
         ]
         
         is_safe = len(critical_threats) == 0
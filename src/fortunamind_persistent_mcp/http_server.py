@@ -113,7 +113,7 @@ async def main():
         settings = get_settings()
         print(f"🌟 Starting FortunaMind Persistent MCP HTTP Server...")
         print(f"   🌐 Server URL: http://{settings.server_host}:{settings.server_port}")
-        print(f"   📖 API Documentation: http://{settings.server_host}:{settings.server_port}/docs" if settings.is_development() else "   📖 API Documentation: Disabled in production")
+        print(f"   📖 API Documentation: http://{settings.server_host}:{settings.server_port}/docs" if settings.is_development else "   📖 API Documentation: Disabled in production")
         print(f"   💖 Health Check: http://{settings.server_host}:{settings.server_port}/health")
         print(f"   🎯 MCP Endpoint: http://{settings.server_host}:{settings.server_port}/mcp")
         print("")
@@ -125,7 +125,7 @@ async def main():
         print("\n🛑 Received shutdown signal")
     except Exception as e:
         print(f"\n❌ HTTP server startup failed: {e}")
-        if get_settings().is_development():
+        if get_settings().is_development:
             import traceback
             traceback.print_exc()
         sys.exit(1)
@@ -124,7 +124,7 @@ async def main():
         if settings.server_mode == "http":
             print(f"🌟 Starting FortunaMind Persistent MCP HTTP Server...")
             print(f"   🌐 Server URL: http://{settings.server_host}:{settings.server_port}")
-            print(f"   📖 API Documentation: http://{settings.server_host}:{settings.server_port}/docs" if settings.is_development() else "   📖 API Documentation: Disabled in production")
+            print(f"   📖 API Documentation: http://{settings.server_host}:{settings.server_port}/docs" if settings.is_development else "   📖 API Documentation: Disabled in production")
             print(f"   💖 Health Check: http://{settings.server_host}:{settings.server_port}/health")
         else:
             print("🌟 Starting FortunaMind Persistent MCP STDIO Server...")
@@ -139,7 +139,7 @@ async def main():
         print("\n🛑 Received shutdown signal")
     except Exception as e:
         print(f"\n❌ Startup failed: {e}")
-        if get_settings().is_development():
+        if get_settings().is_development:
             import traceback
             traceback.print_exc()
         sys.exit(1)
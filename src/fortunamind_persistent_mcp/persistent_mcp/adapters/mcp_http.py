@@ -528,8 +528,8 @@ class MCPHttpAdapter:
             title=settings.mcp_server_name,
             description="Educational crypto tools with persistent storage",
             version="1.0.0",
-            docs_url="/docs" if settings.is_development() else None,
-            redoc_url="/redoc" if settings.is_development() else None
+            docs_url="/docs" if settings.is_development else None,
+            redoc_url="/redoc" if settings.is_development else None
         )
         
         # Initialize endpoint handlers with new persistence library
@@ -567,12 +567,12 @@ class MCPHttpAdapter:
                 "endpoints": {
                     "health": "/health",
                     "mcp": "/mcp (POST)",
-                    "docs": "/docs" if self.settings.is_development() else "disabled"
+                    "docs": "/docs" if self.settings.is_development else "disabled"
                 }
             }
         
         # Development endpoints
-        if self.settings.is_development():
+        if self.settings.is_development:
             @self.app.get("/debug/tools")
             async def debug_tools():
                 """Debug endpoint to list all tools"""
@@ -614,8 +614,8 @@ class MCPHttpAdapter:
                 host=self.host,
                 port=self.port,
                 log_level=self.settings.log_level.lower(),
-                access_log=self.settings.is_development(),
-                reload=self.settings.is_development()
+                access_log=self.settings.is_development,
+                reload=self.settings.is_development
             )
             
             # Create and run server
@@ -658,6 +658,6 @@ class MCPHttpAdapter:
             "endpoints": {
                 "health": f"http://{self.host}:{self.port}/health",
                 "mcp": f"http://{self.host}:{self.port}/mcp",
-                "docs": f"http://{self.host}:{self.port}/docs" if self.settings.is_development() else None
+                "docs": f"http://{self.host}:{self.port}/docs" if self.settings.is_development else None
             }
         }
\ No newline at end of file
@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 # Clean imports using proper package structure
 from fortunamind_persistent_mcp.core.mock import ToolRegistry, AuthContext, ToolResult, FRAMEWORK_AVAILABLE
 from fortunamind_persistent_mcp.core.tool_factory import UnifiedToolFactory, ToolType
+from fortunamind_persistent_mcp.core.base import flush_execution_history
 from fortunamind_persistent_mcp.config import Settings
 from .adapters import MCPStdioAdapter, MCPHttpAdapter
 
@@ -213,6 +214,9 @@ class PersistentMCPServer:
         if self.adapter:
             await self.adapter.cleanup()
         
+        # Write buffered tool execution history before storage goes away
+        await flush_execution_history()
+        
         if self.storage_backend:
             # Storage backend cleanup if supported
             if hasattr(self.storage_backend, 'cleanup'):
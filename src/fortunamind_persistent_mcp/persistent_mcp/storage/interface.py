@@ -78,6 +78,21 @@ class StorageInterface(ABC):
         """
         pass
     
+    async def store_records(self, records: List[StorageRecord]) -> List[str]:
+        """
+        Store several records, returning their IDs in order
+        
+        Backends that can write a batch in one round-trip should override
+        this; the default stores the records one at a time.
+        
+        Args:
+            records: The records to store
+            
+        Returns:
+            The unique record IDs
+        """
+        return [await self.store_record(record) for record in records]
+    
     @abstractmethod
     async def get_record(self, user_id_hash: str, record_id: str) -> Optional[StorageRecord]:
         """
@@ -66,12 +66,13 @@ class MockStorageBackend(StorageInterface):
     ) -> str:
         """Store journal entry in memory"""
         entry_id = str(uuid.uuid4())
+        now_iso = datetime.now(timezone.utc).isoformat()
         entry = {
             "id": entry_id,
             "user_id_hash": user_id_hash,
             "data": entry_data,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
         
         key = f"journal_{user_id_hash}"
@@ -129,14 +130,15 @@ class MockStorageBackend(StorageInterface):
     ) -> str:
         """Store technical indicator data in memory"""
         entry_id = str(uuid.uuid4())
+        now_iso = datetime.now(timezone.utc).isoformat()
         entry = {
             "id": entry_id,
             "user_id_hash": user_id_hash,
             "symbol": symbol,
             "indicator_type": indicator_type,
             "data": data,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
         
         key = f"indicators_{user_id_hash}_{symbol}"
@@ -195,12 +197,13 @@ class MockStorageBackend(StorageInterface):
     ) -> str:
         """Store portfolio snapshot in memory"""
         entry_id = str(uuid.uuid4())
+        now_iso = datetime.now(timezone.utc).isoformat()
         entry = {
             "id": entry_id,
             "user_id_hash": user_id_hash,
             "data": portfolio_data,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
         
         key = f"portfolio_{user_id_hash}"
@@ -246,13 +249,14 @@ class MockStorageBackend(StorageInterface):
     ) -> str:
         """Generic data storage in memory"""
         entry_id = str(uuid.uuid4())
+        now_iso = datetime.now(timezone.utc).isoformat()
         entry = {
             "id": entry_id,
             "user_id_hash": user_id_hash,
             "data_type": data_type.value,
             "data": data,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
         
         key = f"generic_{user_id_hash}_{data_type.value}"
@@ -303,6 +307,7 @@ class MockStorageBackend(StorageInterface):
     async def store_record(self, record: StorageRecord) -> str:
         """Store a generic record"""
         entry_id = str(uuid.uuid4())
+        now_iso = datetime.now(timezone.utc).isoformat()
         entry = {
             "id": entry_id,
             "user_id_hash": record.user_id_hash,
@@ -310,8 +315,8 @@ class MockStorageBackend(StorageInterface):
             "data": record.data,
             "metadata": record.metadata or {},
             "tags": record.tags or [],
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": now_iso,
+            "updated_at": now_iso,
             "expires_at": record.expires_at.isoformat() if record.expires_at else None
         }
         
@@ -4,6 +4,7 @@ Supabase Storage Backend
 Implementation of persistent storage using Supabase PostgreSQL with Row Level Security.
 """
 
+import asyncio
 import logging
 import json
 import uuid
@@ -11,8 +12,10 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
 from dataclasses import asdict
 
+import httpx
+
 try:
-    from supabase import create_client, Client
+    from supabase import create_client, Client, ClientOptions
     SUPABASE_AVAILABLE = True
 except ImportError:
     SUPABASE_AVAILABLE = False
@@ -23,6 +26,9 @@ from fortunamind_persistent_mcp.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# Value -> member map so row conversion skips EnumMeta.__call__
+_DATA_TYPES = {data_type.value: data_type for data_type in DataType}
+
 
 class SupabaseStorageBackend(StorageInterface):
     """
@@ -44,6 +50,7 @@ class SupabaseStorageBackend(StorageInterface):
         
         self.settings = settings
         self.client: Optional[Client] = None
+        self._http: Optional[httpx.Client] = None
         self._initialized = False
         
         logger.info("Supabase storage backend created")
@@ -55,10 +62,17 @@ class SupabaseStorageBackend(StorageInterface):
         
         logger.info("Initializing Supabase storage backend...")
         
-        # Create Supabase client
+        # Create Supabase client on a long-lived HTTP/2 keep-alive pool so
+        # queries reuse warm connections instead of re-handshaking TLS
+        self._http = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
         self.client = create_client(
             self.settings.supabase_url,
-            self.settings.supabase_service_role_key  # Use service role for server operations
+            self.settings.supabase_service_role_key,  # Use service role for server operations
+            options=ClientOptions(httpx_client=self._http)
         )
         
         # Verify connection
@@ -74,7 +88,10 @@ class SupabaseStorageBackend(StorageInterface):
         """Cleanup Supabase resources"""
         logger.info("Cleaning up Supabase storage backend...")
         
-        # Supabase client doesn't require explicit cleanup
+        # Release pooled connections
+        if self._http is not None:
+            self._http.close()
+            self._http = None
         self.client = None
         self._initialized = False
         
@@ -90,7 +107,7 @@ class SupabaseStorageBackend(StorageInterface):
         
         try:
             # Simple query to test connection
-            result = self.client.table("storage_records").select("count", count="exact").limit(0).execute()
+            result = await self._exec(self.client.table("storage_records").select("count", count="exact").limit(0))
             
             return {
                 "status": "healthy",
@@ -110,7 +127,7 @@ class SupabaseStorageBackend(StorageInterface):
         """Verify Supabase connection"""
         try:
             # Test basic connectivity
-            result = self.client.table("storage_records").select("count", count="exact").limit(0).execute()
+            result = await self._exec(self.client.table("storage_records").select("count", count="exact").limit(0))
             logger.info("✅ Supabase connection verified")
             
         except Exception as e:
@@ -126,7 +143,7 @@ class SupabaseStorageBackend(StorageInterface):
         
         try:
             # Try to access the main table
-            self.client.table("storage_records").select("id").limit(1).execute()
+            await self._exec(self.client.table("storage_records").select("id").limit(1))
             logger.info("✅ Database schema verified")
             
         except Exception as e:
@@ -135,16 +152,9 @@ class SupabaseStorageBackend(StorageInterface):
     
     # === CRUD Operations ===
     
-    async def store_record(self, record: StorageRecord) -> str:
-        """Store a record and return its ID"""
-        if not self.client:
-            raise RuntimeError("Storage backend not initialized")
-        
-        # Generate ID if not provided
-        record_id = record.record_id or str(uuid.uuid4())
-        
-        # Prepare data for storage
-        storage_data = {
+    def _record_row(self, record: StorageRecord, record_id: str, now_iso: str) -> Dict[str, Any]:
+        """Build the storage_records row for a record"""
+        return {
             "id": record_id,
             "user_id_hash": record.user_id_hash,
             "data_type": record.data_type.value,
@@ -153,13 +163,24 @@ class SupabaseStorageBackend(StorageInterface):
             "metadata": json.dumps(record.metadata) if record.metadata else None,
             "tags": record.tags,
             "expires_at": record.expires_at.isoformat() if record.expires_at else None,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
+    
+    async def store_record(self, record: StorageRecord) -> str:
+        """Store a record and return its ID"""
+        if not self.client:
+            raise RuntimeError("Storage backend not initialized")
+        
+        # Generate ID if not provided
+        record_id = record.record_id or str(uuid.uuid4())
+        
+        # Prepare data for storage
+        storage_data = self._record_row(record, record_id, datetime.now(timezone.utc).isoformat())
         
         try:
             # Insert record (RLS will ensure user isolation)
-            result = self.client.table("storage_records").insert(storage_data).execute()
+            result = await self._exec(self.client.table("storage_records").insert(storage_data))
             
             if not result.data:
                 raise RuntimeError("Failed to store record")
@@ -171,15 +192,39 @@ class SupabaseStorageBackend(StorageInterface):
             logger.error(f"Failed to store record: {e}")
             raise
     
+    async def store_records(self, records: List[StorageRecord]) -> List[str]:
+        """Store several records with a single insert and return their IDs"""
+        if not self.client:
+            raise RuntimeError("Storage backend not initialized")
+        
+        if not records:
+            return []
+        
+        now_iso = datetime.now(timezone.utc).isoformat()
+        record_ids = [record.record_id or str(uuid.uuid4()) for record in records]
+        rows = [
+            self._record_row(record, record_id, now_iso)
+            for record, record_id in zip(records, record_ids)
+        ]
+        
+        try:
+            await self._exec(self.client.table("storage_records").insert(rows, returning="minimal"))
+            logger.debug(f"Stored {len(rows)} records")
+            return record_ids
+            
+        except Exception as e:
+            logger.error(f"Failed to store records: {e}")
+            raise
+    
     async def get_record(self, user_id_hash: str, record_id: str) -> Optional[StorageRecord]:
         """Get a specific record by ID"""
         if not self.client:
             raise RuntimeError("Storage backend not initialized")
         
         try:
-            result = self.client.table("storage_records").select("*").eq(
+            result = await self._exec(self.client.table("storage_records").select("*").eq(
                 "id", record_id
-            ).eq("user_id_hash", user_id_hash).single().execute()
+            ).eq("user_id_hash", user_id_hash).single())
             
             if not result.data:
                 return None
@@ -228,7 +273,7 @@ class SupabaseStorageBackend(StorageInterface):
                 query = query.offset(filter_criteria.offset)
             
             # Execute query
-            result = query.execute()
+            result = await self._exec(query)
             
             # Convert results
             records = [self._convert_to_storage_record(row) for row in result.data]
@@ -256,11 +301,13 @@ class SupabaseStorageBackend(StorageInterface):
             update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
             
             # Update record (RLS ensures user isolation)
-            result = self.client.table("storage_records").update(update_data).eq(
+            result = await self._exec(self.client.table("storage_records").update(
+                update_data, count="exact", returning="minimal"
+            ).eq(
                 "id", record_id
-            ).eq("user_id_hash", user_id_hash).execute()
+            ).eq("user_id_hash", user_id_hash))
             
-            success = bool(result.data)
+            success = bool(result.count)
             if success:
                 logger.debug(f"Updated record {record_id} for user {user_id_hash[:8]}...")
             
@@ -277,11 +324,13 @@ class SupabaseStorageBackend(StorageInterface):
         
         try:
             # Delete record (RLS ensures user isolation)
-            result = self.client.table("storage_records").delete().eq(
+            result = await self._exec(self.client.table("storage_records").delete(
+                count="exact", returning="minimal"
+            ).eq(
                 "id", record_id
-            ).eq("user_id_hash", user_id_hash).execute()
+            ).eq("user_id_hash", user_id_hash))
             
-            success = bool(result.data)
+            success = bool(result.count)
             if success:
                 logger.debug(f"Deleted record {record_id} for user {user_id_hash[:8]}...")
             
@@ -512,34 +561,44 @@ class SupabaseStorageBackend(StorageInterface):
             raise RuntimeError("Storage backend not initialized")
         
         try:
-            # Get record counts by type
-            stats = {}
+            table = self.client.table
+            data_types = list(DataType)
+            
+            # None of these queries depend on each other, so issue them
+            # concurrently rather than paying one round-trip per query
+            type_queries = [
+                table("storage_records").select("count", count="exact").eq(
+                    "user_id_hash", user_id_hash
+                ).eq("data_type", data_type.value)
+                for data_type in data_types
+            ]
+            total_query = table("storage_records").select(
+                "count", count="exact"
+            ).eq("user_id_hash", user_id_hash)
+            oldest_query = table("storage_records").select(
+                "timestamp"
+            ).eq("user_id_hash", user_id_hash).order("timestamp").limit(1)
+            newest_query = table("storage_records").select(
+                "timestamp"
+            ).eq("user_id_hash", user_id_hash).order("timestamp", desc=True).limit(1)
             
-            for data_type in DataType:
-                result = self.client.table("storage_records").select(
-                    "count", count="exact"
-                ).eq("user_id_hash", user_id_hash).eq(
-                    "data_type", data_type.value
-                ).execute()
-                
-                stats[data_type.value] = result.count or 0
+            *type_results, total_result, oldest, newest = await asyncio.gather(
+                *(self._exec(query) for query in type_queries),
+                self._exec(total_query),
+                self._exec(oldest_query),
+                self._exec(newest_query)
+            )
             
-            # Get total storage usage (approximate)
-            total_result = self.client.table("storage_records").select(
-                "count", count="exact"
-            ).eq("user_id_hash", user_id_hash).execute()
+            # Get record counts by type
+            stats = {
+                data_type.value: result.count or 0
+                for data_type, result in zip(data_types, type_results)
+            }
             
+            # Get total storage usage (approximate)
             stats["total_records"] = total_result.count or 0
             
             # Get oldest and newest records
-            oldest = self.client.table("storage_records").select(
-                "timestamp"
-            ).eq("user_id_hash", user_id_hash).order("timestamp").limit(1).execute()
-            
-            newest = self.client.table("storage_records").select(
-                "timestamp"
-            ).eq("user_id_hash", user_id_hash).order("timestamp", desc=True).limit(1).execute()
-            
             if oldest.data:
                 stats["oldest_record"] = oldest.data[0]["timestamp"]
             
@@ -561,11 +620,12 @@ class SupabaseStorageBackend(StorageInterface):
             # Delete records where expires_at < now
             now = datetime.now(timezone.utc).isoformat()
             
-            result = self.client.table("storage_records").delete().lt(
-                "expires_at", now
-            ).execute()
+            # Only the affected row count is needed, not the deleted rows
+            result = await self._exec(self.client.table("storage_records").delete(
+                count="exact", returning="minimal"
+            ).lt("expires_at", now))
             
-            count = len(result.data) if result.data else 0
+            count = result.count or 0
             
             if count > 0:
                 logger.info(f"Cleaned up {count} expired records")
@@ -576,12 +636,16 @@ class SupabaseStorageBackend(StorageInterface):
             logger.error(f"Failed to cleanup expired records: {e}")
             return 0
     
+    async def _exec(self, query: Any) -> Any:
+        """Execute a supabase-py query without blocking the event loop"""
+        return await asyncio.to_thread(query.execute)
+    
     def _convert_to_storage_record(self, row: Dict[str, Any]) -> StorageRecord:
         """Convert database row to StorageRecord"""
         return StorageRecord(
             record_id=row["id"],
             user_id_hash=row["user_id_hash"],
-            data_type=DataType(row["data_type"]),
+            data_type=_DATA_TYPES[row["data_type"]],
             data=json.loads(row["data"]) if isinstance(row["data"], str) else row["data"],
             timestamp=datetime.fromisoformat(row["timestamp"].replace("Z", "+00:00")),
             metadata=json.loads(row["metadata"]) if row.get("metadata") and isinstance(row["metadata"], str) else row.get("metadata"),
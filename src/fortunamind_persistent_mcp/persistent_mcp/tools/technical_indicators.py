@@ -156,7 +156,7 @@ Perfect for crypto-curious professionals who want to understand market trends wi
         
         try:
             # Validate symbol
-            if symbol not in self.settings.supported_symbols:
+            if not self.settings.supports_symbol(symbol):
                 return {
                     "error": f"Symbol {symbol} not supported. Supported symbols: {', '.join(self.settings.supported_symbols)}",
                     "educational_note": "Start with major cryptocurrencies like BTC or ETH - they have the most reliable data and are easier to analyze."
@@ -0,0 +1,90 @@
+"""
+Tests for batched execution history
+
+Tests that tool execution history is buffered and written with
+store_records.
+"""
+
+import asyncio
+import pytest
+
+from fortunamind_persistent_mcp.core import base
+from fortunamind_persistent_mcp.core.base import _HistoryBatcher
+
+
+class RecordingStorage:
+    """Storage double that records batch sizes"""
+
+    def __init__(self):
+        self.batches = []
+
+    async def store_records(self, records):
+        self.batches.append(list(records))
+
+
+class SlowStorage(RecordingStorage):
+    """Storage double whose writes take a while"""
+
+    async def store_records(self, records):
+        await asyncio.sleep(0.05)
+        await super().store_records(records)
+
+
+class TestHistoryBatcher:
+    """Test cases for _HistoryBatcher"""
+
+    @pytest.mark.asyncio
+    async def test_flushes_full_batches(self):
+        """Batches never exceed max_batch"""
+        storage = RecordingStorage()
+        batcher = _HistoryBatcher(storage, max_batch=4, flush_interval=60)
+
+        for i in range(10):
+            batcher.submit(i)
+        await asyncio.sleep(0)
+        await batcher.flush()
+
+        assert [len(b) for b in storage.batches] == [4, 4, 2]
+        assert [r for b in storage.batches for r in b] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_interval(self):
+        """A partial batch is written once the interval elapses"""
+        storage = RecordingStorage()
+        batcher = _HistoryBatcher(storage, max_batch=64, flush_interval=0.01)
+
+        batcher.submit("a")
+        batcher.submit("b")
+        assert storage.batches == []
+
+        await asyncio.sleep(0.05)
+        assert storage.batches == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_flush_releases_storage(self):
+        """flush_execution_history writes pending records and drops the batcher"""
+        storage = RecordingStorage()
+        base._history_batcher(storage).submit("a")
+
+        await base.flush_execution_history()
+
+        assert storage.batches == [["a"]]
+        assert storage not in base._HISTORY_BATCHERS
+
+    @pytest.mark.asyncio
+    async def test_shutdown_flush_waits_for_in_flight_writes(self):
+        """Batches already being written are stored before the flush returns"""
+        storage = SlowStorage()
+        batcher = base._HISTORY_BATCHERS[storage] = _HistoryBatcher(
+            storage, max_batch=2, flush_interval=60
+        )
+
+        batcher.submit("a")
+        batcher.submit("b")
+        await asyncio.sleep(0)  # background write takes ["a", "b"]
+        batcher.submit("c")
+
+        await base.flush_execution_history()
+
+        assert sorted(r for b in storage.batches for r in b) == ["a", "b", "c"]
+        assert batcher._timer.done()
@@ -0,0 +1,106 @@
+"""
+Tests for MockStorage
+
+Tests pagination behaviour of the in-memory persistence backend.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from fortunamind_persistence.storage.mock_backend import MockStorage
+from fortunamind_persistence.storage.interfaces import (
+    StorageRecord,
+    RecordType,
+    encode_page_cursor,
+)
+
+
+class TestMockStoragePagination:
+    """Test cases for offset and keyset pagination"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.storage = MockStorage()
+        self.user_id = "a" * 64
+
+    async def _store_records(self, count: int):
+        base = datetime(2025, 1, 1)
+        for i in range(count):
+            await self.storage.store_record(StorageRecord(
+                id=f"rec-{i:03d}",
+                user_id=self.user_id,
+                record_type=RecordType.CUSTOM,
+                data={"n": i},
+                created_at=base + timedelta(minutes=i // 2)  # pairs share a timestamp
+            ))
+
+    @pytest.mark.asyncio
+    async def test_query_records_keyset_matches_offset(self):
+        """Walking pages with a cursor yields the same order as offsets"""
+        await self._store_records(9)
+
+        by_offset = []
+        for offset in range(0, 9, 4):
+            page = await self.storage.query_records(self.user_id, limit=4, offset=offset)
+            by_offset.extend(r.id for r in page)
+
+        by_cursor = []
+        before = None
+        while True:
+            page = await self.storage.query_records(self.user_id, limit=4, before=before)
+            if not page:
+                break
+            by_cursor.extend(r.id for r in page)
+            before = (page[-1].created_at, page[-1].id)
+
+        assert by_cursor == by_offset
+        assert len(set(by_cursor)) == 9
+
+    @pytest.mark.asyncio
+    async def test_journal_entries_keyset(self):
+        """Journal entries page with the (created_at, id) cursor"""
+        for i in range(5):
+            await self.storage.store_journal_entry(self.user_id, f"entry {i}")
+
+        first = await self.storage.get_journal_entries(self.user_id, limit=3)
+        last = first[-1]
+        cursor = (datetime.fromisoformat(last['created_at']), last['id'])
+        second = await self.storage.get_journal_entries(self.user_id, limit=3, before=cursor)
+
+        assert len(first) == 3
+        assert len(second) == 2
+        assert not {e['id'] for e in first} & {e['id'] for e in second}
+
+    @pytest.mark.asyncio
+    async def test_journal_entries_encoded_cursor(self):
+        """An encoded string cursor pages the same as the tuple form"""
+        for i in range(5):
+            await self.storage.store_journal_entry(self.user_id, f"entry {i}")
+
+        first = await self.storage.get_journal_entries(self.user_id, limit=3)
+        last = first[-1]
+        created_at = datetime.fromisoformat(last['created_at'])
+        cursor = encode_page_cursor(created_at, last['id'])
+
+        assert isinstance(cursor, str)
+        by_string = await self.storage.get_journal_entries(self.user_id, limit=3, before=cursor)
+        by_tuple = await self.storage.get_journal_entries(
+            self.user_id, limit=3, before=(created_at, last['id'])
+        )
+        assert [e['id'] for e in by_string] == [e['id'] for e in by_tuple]
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_is_rejected(self):
+        """A string cursor without an id raises ValueError"""
+        with pytest.raises(ValueError):
+            await self.storage.query_records(self.user_id, before="2025-01-01T00:00:00")
+
+    @pytest.mark.asyncio
+    async def test_iter_records_streams_every_record(self):
+        """iter_records walks all pages in order"""
+        await self._store_records(7)
+
+        streamed = [r.id async for r in self.storage.iter_records(self.user_id, page_size=3)]
+        listed = [r.id for r in await self.storage.query_records(self.user_id, limit=100)]
+
+        assert streamed == listed
@@ -0,0 +1,64 @@
+"""
+Tests for compiled tool parameter validation
+
+Tests that compile_parameter_validator reports the same errors the
+schema interpreter did.
+"""
+
+from fortunamind_persistent_mcp.core.base import compile_parameter_validator
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "symbol": {"type": "string", "minLength": 2, "maxLength": 5},
+        "period": {"type": "integer", "minimum": 1, "maximum": 200},
+        "action": {"type": "string", "enum": ["add", "list"]},
+    },
+    "required": ["symbol"],
+}
+
+
+class TestCompiledParameterValidator:
+    """Test cases for compile_parameter_validator"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.validate = compile_parameter_validator(SCHEMA)
+
+    def test_valid_parameters(self):
+        """Valid parameters produce no errors"""
+        assert self.validate({"symbol": "BTC", "period": 14, "action": "add"}) == []
+
+    def test_missing_required_and_constraint_errors(self):
+        """Errors keep their codes and come back in field order"""
+        errors = self.validate({"symbol": None, "period": 0, "action": "drop", "extra": 1})
+
+        assert [e.code for e in errors] == [
+            "MISSING_REQUIRED_FIELD",
+            "NUMBER_TOO_SMALL",
+            "INVALID_ENUM_VALUE",
+        ]
+        assert errors[1].message == "Field 'period' must be at least 1"
+
+    def test_type_and_length_errors(self):
+        """Wrong types are reported; length checks only apply to strings"""
+        errors = self.validate({"symbol": "B", "period": "14"})
+
+        assert [(e.field, e.code) for e in errors] == [
+            ("symbol", "STRING_TOO_SHORT"),
+            ("period", "INVALID_TYPE"),
+        ]
+
+    def test_schema_without_properties(self):
+        """Schemas without properties accept anything"""
+        assert compile_parameter_validator({"type": "object"})({"anything": 1}) == []
+
+    def test_unconstrained_schema_skips_validation(self):
+        """Schemas with no required fields or checks share the no-op validator"""
+        validate = compile_parameter_validator(
+            {"type": "object", "properties": {"note": {"description": "free text"}}, "required": []}
+        )
+
+        assert validate is compile_parameter_validator({"type": "object"})
+        assert validate({"note": 123}) == []
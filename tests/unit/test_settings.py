@@ -0,0 +1,71 @@
+"""
+Tests for Settings derived values
+
+Tests that values derived from Settings fields follow variants created
+with model_copy(update=...), and how Settings loads .env files.
+"""
+
+import json
+
+from fortunamind_persistent_mcp.config import Environment, Settings
+
+
+class TestSettingsVariants:
+    """Test cases for derived values on model_copy variants"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.settings = Settings(environment=Environment.DEVELOPMENT)
+
+    def test_environment_checks_follow_copy(self):
+        """is_development / is_production reflect the copied environment"""
+        assert self.settings.is_development
+
+        production = self.settings.model_copy(update={"environment": Environment.PRODUCTION})
+
+        assert production.is_production
+        assert not production.is_development
+        assert self.settings.is_development
+
+    def test_symbol_set_follows_copy(self):
+        """supports_symbol uses the copied supported_symbols"""
+        assert not self.settings.supports_symbol("XYZ-USD")
+
+        variant = self.settings.model_copy(update={"supported_symbols": ("XYZ-USD",)})
+
+        assert variant.supports_symbol("XYZ-USD")
+        assert variant.supported_symbols_set == frozenset({"XYZ-USD"})
+
+    def test_db_config_follows_copy(self):
+        """db_config reflects copied pool settings"""
+        assert self.settings.db_config["pool_size"] == self.settings.db_pool_size
+
+        variant = self.settings.model_copy(update={"db_pool_size": 3})
+
+        assert variant.db_config["pool_size"] == 3
+        assert variant.get_db_config()["pool_size"] == 3
+
+    def test_security_config_is_a_plain_dict(self):
+        """get_security_config returns a mutable, JSON-serialisable copy"""
+        config = self.settings.get_security_config()
+        config["sensitivity"] = "custom"
+
+        assert isinstance(config, dict)
+        assert json.loads(json.dumps(config))["sensitivity"] == "custom"
+        assert self.settings.get_security_config()["sensitivity"] != "custom"
+
+
+class TestSettingsEnvFile:
+    """Test cases for loading .env files"""
+
+    def test_env_file_override_is_used(self, tmp_path, monkeypatch):
+        """Settings(_env_file=...) reads the given file, not the default"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("MCP_SERVER_NAME", raising=False)
+        (tmp_path / ".env").write_text("MCP_SERVER_NAME=from-default\n")
+        (tmp_path / "alt.env").write_text("MCP_SERVER_NAME=from-alt\n")
+
+        settings = Settings(_env_file="alt.env")
+
+        assert settings.mcp_server_name == "from-alt"
+        assert Settings(_env_file=None).mcp_server_name != "from-default"
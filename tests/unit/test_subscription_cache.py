@@ -0,0 +1,178 @@
+"""
+Tests for SubscriptionCache
+
+Tests TTL expiry and LRU eviction of cached validation results, and how
+SubscriptionValidator coalesces and batches cache misses.
+"""
+
+import asyncio
+import pytest
+
+from fortunamind_persistence.subscription.models import SubscriptionValidationResult
+from fortunamind_persistence.subscription.validator import (
+    SubscriptionCache,
+    SubscriptionValidator,
+    _key_digest,
+)
+
+
+class TestSubscriptionCache:
+    """Test cases for SubscriptionCache"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.result = SubscriptionValidationResult(is_valid=True)
+
+    def test_hit_is_marked(self):
+        """Cached results come back flagged as cache hits"""
+        cache = SubscriptionCache(ttl_seconds=60)
+        cache.set(("a@example.com", "a"), self.result)
+
+        cached = cache.get(("a@example.com", "a"))
+        assert cached is not None and cached.cache_hit
+        assert not self.result.cache_hit
+
+    def test_expired_entries_are_dropped_on_read(self):
+        """An expired entry is a miss and is removed"""
+        cache = SubscriptionCache(ttl_seconds=0)
+        cache.set(("a@example.com", "a"), self.result)
+
+        assert cache.get(("a@example.com", "a")) is None
+        assert len(cache._cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Once full, the entry read least recently is evicted first"""
+        cache = SubscriptionCache(ttl_seconds=60, max_size=2)
+        cache.set(("a@example.com", "a"), self.result)
+        cache.set(("b@example.com", "b"), self.result)
+        cache.get(("a@example.com", "a"))
+        cache.set(("c@example.com", "c"), self.result)
+
+        assert cache.get(("b@example.com", "b")) is None
+        assert cache.get(("a@example.com", "a")) is not None
+        assert cache.get(("c@example.com", "c")) is not None
+
+    def test_invalidate_removes_only_that_email(self):
+        """invalidate() drops every entry for the email and keeps the rest"""
+        cache = SubscriptionCache(ttl_seconds=60)
+        cache.set(("a@example.com", "k1"), self.result)
+        cache.set(("a@example.com", "k2"), self.result)
+        cache.set(("b@example.com", "k1"), self.result)
+        cache.invalidate("a@example.com")
+
+        assert list(cache._cache) == [("b@example.com", "k1")]
+
+    def test_validator_invalidate_normalizes_email(self):
+        """invalidate_cache() normalizes the email and tolerates an empty one"""
+        validator = SubscriptionValidator()
+        validator.cache.set(("a@example.com", "k1"), self.result)
+
+        validator.invalidate_cache("")
+        validator.invalidate_cache("  A@Example.com ")
+
+        assert len(validator.cache._cache) == 0
+
+
+class CountingValidator(SubscriptionValidator):
+    """Validator whose database lookup is slow and counted"""
+
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+
+    async def _validate_in_database(self, email, subscription_key):
+        self.lookups += 1
+        await asyncio.sleep(0.01)
+        return SubscriptionValidationResult(is_valid=True)
+
+
+class TestValidationCoalescing:
+    """Test cases for sharing one lookup between concurrent misses"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_lookup(self):
+        """N concurrent validations of a cold key hit the database once"""
+        validator = CountingValidator()
+        key = "fm_sub_" + "a" * 43
+
+        results = await asyncio.gather(*(
+            validator.validate("user@example.com", key) for _ in range(10)
+        ))
+
+        assert validator.lookups == 1
+        assert all(r.is_valid for r in results)
+        assert not validator._in_flight
+
+    @pytest.mark.asyncio
+    async def test_cancelled_owner_does_not_strand_waiters(self):
+        """If the caller doing the lookup is cancelled, waiters retry it"""
+        validator = CountingValidator()
+        key = "fm_sub_" + "b" * 43
+
+        owner = asyncio.create_task(validator.validate("user@example.com", key))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(validator.validate("user@example.com", key))
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        result = await waiter
+        assert result.is_valid
+        assert validator.lookups == 2
+
+    def test_lookup_from_another_event_loop_is_not_awaited(self):
+        """A lookup in flight on a different loop does not block this one"""
+        validator = CountingValidator()
+        key = "fm_sub_" + "c" * 43
+        other_loop = asyncio.new_event_loop()
+        try:
+            cache_key = ("user@example.com", _key_digest(key))
+            validator._in_flight[cache_key] = other_loop.create_future()
+
+            result = asyncio.run(validator.validate("user@example.com", key))
+        finally:
+            other_loop.close()
+
+        assert result.is_valid
+        assert validator.lookups == 1
+
+
+class TestValidateMany:
+    """Test cases for batched validation"""
+
+    @pytest.mark.asyncio
+    async def test_each_distinct_miss_is_looked_up_once(self):
+        """Duplicate misses share a lookup; hits and bad input skip it"""
+        validator = CountingValidator()
+        key_a = "fm_sub_" + "a" * 43
+        key_b = "fm_sub_" + "b" * 43
+        await validator.validate("cached@example.com", key_a)
+        validator.lookups = 0
+
+        results = await validator.validate_many([
+            ("one@example.com", key_a),
+            ("cached@example.com", key_a),
+            ("two@example.com", "not-a-key"),
+            ("One@Example.com", key_a),
+            ("three@example.com", key_b),
+        ])
+
+        assert validator.lookups == 2
+        assert [r.is_valid for r in results] == [True, True, False, True, True]
+        assert results[1].cache_hit
+        assert results[2].error_message == "Invalid subscription key format"
+        assert results[0] is results[3]
+
+    @pytest.mark.asyncio
+    async def test_shares_lookups_with_concurrent_validate(self):
+        """A batch and a concurrent validate() of the same key hit the database once"""
+        validator = CountingValidator()
+        key = "fm_sub_" + "a" * 43
+
+        single, batch = await asyncio.gather(
+            validator.validate("user@example.com", key),
+            validator.validate_many([("user@example.com", key)]),
+        )
+
+        assert validator.lookups == 1
+        assert single.is_valid and batch[0].is_valid
+        assert not validator._in_flight
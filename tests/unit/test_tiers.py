@@ -0,0 +1,55 @@
+"""
+Tests for TierDefinitions
+
+Tests feature access, API call limits, and upgrade recommendations.
+"""
+
+from fortunamind_persistence.subscription.tiers import SubscriptionTier, TierDefinitions
+
+
+class TestTierDefinitions:
+    """Test cases for TierDefinitions"""
+
+    def test_has_feature(self):
+        """Feature checks follow each tier's feature set"""
+        assert TierDefinitions.has_feature(SubscriptionTier.FREE, "portfolio_view")
+        assert not TierDefinitions.has_feature(SubscriptionTier.FREE, "journal_persistence")
+        assert TierDefinitions.has_feature(SubscriptionTier.ENTERPRISE, "api_access")
+
+    def test_can_make_api_call(self):
+        """Hourly, daily and monthly limits are enforced; -1 means unlimited"""
+        assert TierDefinitions.can_make_api_call(SubscriptionTier.FREE, (59, 0, 0))
+        assert not TierDefinitions.can_make_api_call(SubscriptionTier.FREE, (60, 0, 0))
+        assert not TierDefinitions.can_make_api_call(SubscriptionTier.FREE, (0, 1000, 0))
+        assert TierDefinitions.can_make_api_call(SubscriptionTier.ENTERPRISE, (10**9, 10**9, 10**9))
+
+    def test_upgrade_recommendation_uses_tier_order(self):
+        """The cheapest tier above the current one that has the feature is recommended"""
+        assert TierDefinitions.get_upgrade_recommendation(
+            SubscriptionTier.STARTER, "risk_analysis"
+        ) == SubscriptionTier.PREMIUM
+        assert TierDefinitions.get_upgrade_recommendation(
+            SubscriptionTier.FREE, "journal_persistence"
+        ) == SubscriptionTier.STARTER
+        assert TierDefinitions.get_upgrade_recommendation(
+            SubscriptionTier.PREMIUM, "risk_analysis"
+        ) is None
+        assert TierDefinitions.get_upgrade_recommendation(
+            SubscriptionTier.FREE, "unknown_feature"
+        ) is None
+
+    def test_get_tier_from_string(self):
+        """Tier names parse case-insensitively; unknown names give None"""
+        assert TierDefinitions.get_tier_from_string("Premium") == SubscriptionTier.PREMIUM
+        assert TierDefinitions.get_tier_from_string("platinum") is None
+
+    def test_has_all_features(self):
+        """Subset checks need every listed feature; unknown names fail"""
+        assert TierDefinitions.has_all_features(
+            SubscriptionTier.STARTER, ["portfolio_view", "journal_persistence"]
+        )
+        assert not TierDefinitions.has_all_features(
+            SubscriptionTier.STARTER, ["journal_persistence", "risk_analysis"]
+        )
+        assert not TierDefinitions.has_all_features(SubscriptionTier.ENTERPRISE, ["unknown_feature"])
+        assert TierDefinitions.has_all_features(SubscriptionTier.FREE, [])
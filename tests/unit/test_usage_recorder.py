@@ -0,0 +1,80 @@
+"""
+Tests for UsageRecorder
+
+Tests write-behind batching of usage records into storage.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+
+from fortunamind_persistence.storage.mock_backend import MockStorage
+from fortunamind_persistence.storage.interfaces import RecordType
+from fortunamind_persistence.subscription.models import UsageRecord
+from fortunamind_persistence.subscription.tiers import SubscriptionTier
+from fortunamind_persistence.subscription.usage import UsageRecorder
+
+
+class BatchCountingStorage(MockStorage):
+    """MockStorage that remembers the size of each batch it receives"""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def store_records(self, records):
+        self.batches.append(len(records))
+        return await super().store_records(records)
+
+
+class TestUsageRecorder:
+    """Test cases for UsageRecorder"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.storage = BatchCountingStorage()
+        self.user_id = "b" * 64
+
+    def _usage(self, endpoint: str = "/tools/portfolio") -> UsageRecord:
+        return UsageRecord(
+            user_id=self.user_id,
+            endpoint=endpoint,
+            timestamp=datetime.utcnow(),
+            tier=SubscriptionTier.PREMIUM
+        )
+
+    @pytest.mark.asyncio
+    async def test_records_are_written_in_batches(self):
+        """Queued records are flushed together, not one insert each"""
+        recorder = UsageRecorder(self.storage, max_batch=4, flush_interval=0.05)
+        recorder.start()
+        for _ in range(10):
+            assert recorder.record(self._usage())
+        await asyncio.sleep(0.2)
+        await recorder.stop()
+
+        stored = await self.storage.query_records(self.user_id, RecordType.USAGE)
+        assert len(stored) == 10
+        assert self.storage.batches == [4, 4, 2]
+        assert stored[0].data["tier"] == "premium"
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_buffered_records(self):
+        """stop() writes records the flusher has not reached yet"""
+        recorder = UsageRecorder(self.storage, flush_interval=10)
+        recorder.start()
+        recorder.record(self._usage())
+        recorder.record(self._usage("/tools/journal"))
+        await recorder.stop()
+
+        stored = await self.storage.query_records(self.user_id, RecordType.USAGE)
+        assert {r.data["endpoint"] for r in stored} == {"/tools/portfolio", "/tools/journal"}
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_records(self):
+        """record() never blocks; overflow is counted and dropped"""
+        recorder = UsageRecorder(self.storage, max_queue=2)
+        assert recorder.record(self._usage())
+        assert recorder.record(self._usage())
+        assert not recorder.record(self._usage())
+        assert recorder.dropped == 1